@@ -10,6 +10,9 @@ from typing import List, Optional, Union
 from .models import KernelModule, BuiltinModule
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 class ModuleFilter:
     """Filter modules based on various criteria."""
     
@@ -99,11 +102,11 @@ class ModuleDisplay:
     @staticmethod
     def format_size(size_bytes: int) -> str:
         """Convert bytes to human readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        if size_bytes < 1:
+            return "0.0 B"
+        # Each unit step is 10 bits, so the bit length picks the unit directly
+        unit_idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (unit_idx * 10)):.1f} {_SIZE_UNITS[unit_idx]}"
     
     @staticmethod
     def display_modules(modules: List[KernelModule], builtin_modules: List[BuiltinModule] = None, 
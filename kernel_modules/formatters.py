@@ -11,9 +11,13 @@ import io
 import datetime
 import platform
 import os
+import sys
 import glob
+from html import escape
 from typing import List, Dict, Union
 from .models import KernelModule, BuiltinModule
+from .parsers import ModuleParser
+from .filters import ModuleDisplay
 
 
 class BaseFormatter:
@@ -187,61 +191,8 @@ class HTMLFormatter(BaseFormatter):
             str: Module description, or empty string if not found
         """
         try:
-            from elftools.elf.elffile import ELFFile
-            import tempfile
-            import zstandard as zstd
-            
-            # Handle compressed modules
-            if file_path.endswith('.ko.zst'):
-                with tempfile.NamedTemporaryFile(suffix='.ko', delete=False) as temp_file:
-                    temp_path = temp_file.name
-                    
-                    with open(file_path, 'rb') as compressed_file:
-                        dctx = zstd.ZstdDecompressor()
-                        with dctx.stream_reader(compressed_file) as reader:
-                            temp_file.write(reader.read())
-                    
-                    # Extract description from decompressed file
-                    description = HTMLFormatter._extract_description_from_elf_file(temp_path)
-                    
-                    # Clean up temporary file
-                    os.unlink(temp_path)
-                    
-                    return description
-            else:
-                return HTMLFormatter._extract_description_from_elf_file(file_path)
-                
-        except Exception:
-            return ""
-    
-    @staticmethod
-    def _extract_description_from_elf_file(file_path: str) -> str:
-        """
-        Extract description from ELF file.
-        
-        Args:
-            file_path: Path to the .ko file
-            
-        Returns:
-            str: Module description, or empty string if not found
-        """
-        try:
-            from elftools.elf.elffile import ELFFile
-            
-            with open(file_path, 'rb') as f:
-                elf = ELFFile(f)
-                modinfo_section = elf.get_section_by_name('.modinfo')
-                if not modinfo_section:
-                    return ""
-                
-                modinfo_data = modinfo_section.data()
-                modinfo_strings = modinfo_data.split(b'\x00')
-                
-                for entry in modinfo_strings:
-                    if entry.startswith(b'description='):
-                        return entry.split(b'=', 1)[1].decode('utf-8', errors='ignore')
-                
-                return ""
+            # Reuse the memory-mapped .modinfo scan used for loaded modules
+            return ModuleParser._extract_description_from_elf(file_path)
         except Exception:
             return ""
     
@@ -261,6 +212,9 @@ class HTMLFormatter(BaseFormatter):
                 'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             }
         
+        # Host details end up in the markup, so escape them like module fields
+        system_info = {key: escape(str(value)) for key, value in system_info.items()}
+        
         # Calculate statistics
         loadable_count = len(modules)
         builtin_count = len(builtin_modules) if builtin_modules else 0
@@ -274,15 +228,6 @@ class HTMLFormatter(BaseFormatter):
         # Calculate total size
         total_size = sum(module.size for module in modules if isinstance(module, KernelModule))
         
-        # Group modules by status
-        status_groups = {}
-        for module in modules:
-            if isinstance(module, KernelModule):
-                status = module.status
-                if status not in status_groups:
-                    status_groups[status] = 0
-                status_groups[status] += 1
-        
         # Generate HTML
         html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -792,18 +737,18 @@ class HTMLFormatter(BaseFormatter):
         # Add loadable modules
         for module in modules:
             if isinstance(module, KernelModule):
-                deps_str = ', '.join(module.dependencies) if module.dependencies else 'None'
-                file_path = module.file_path or 'N/A'
-                description = module.description or 'N/A'
+                deps_str = escape(', '.join(module.dependencies) if module.dependencies else 'None')
+                file_path = escape(module.file_path or 'N/A')
+                description = escape(module.description or 'N/A')
                 html += f"""
                         <tr>
-                            <td><strong>{module.name}</strong></td>
+                            <td><strong>{escape(module.name)}</strong></td>
                             <td>{self._format_size(module.size)}</td>
                             <td>{module.ref_count}</td>
                             <td class="dependencies" title="{deps_str}">{deps_str}</td>
                             <td><code>{file_path}</code></td>
                             <td>{description}</td>
-                            <td><code>{module.address}</code></td>
+                            <td><code>{escape(module.address)}</code></td>
                         </tr>"""
         
         html += """
@@ -833,8 +778,8 @@ class HTMLFormatter(BaseFormatter):
             for module in builtin_modules:
                 html += f"""
                             <tr>
-                                <td><strong>{module.name}</strong></td>
-                                <td>{module.description or 'N/A'}</td>
+                                <td><strong>{escape(module.name)}</strong></td>
+                                <td>{escape(module.description or 'N/A')}</td>
                             </tr>"""
             
             html += """
@@ -866,11 +811,11 @@ class HTMLFormatter(BaseFormatter):
                         <tbody>"""
             
             for module in unloaded_modules:
-                file_path = module['file_path']
-                description = module['description'] or 'N/A'
+                file_path = escape(module['file_path'])
+                description = escape(module['description'] or 'N/A')
                 html += f"""
                             <tr>
-                                <td><strong>{module['name']}</strong></td>
+                                <td><strong>{escape(module['name'])}</strong></td>
                                 <td>{self._format_size(module['size'])}</td>
                                 <td><code>{file_path}</code></td>
                                 <td>{description}</td>
@@ -899,8 +844,4 @@ class HTMLFormatter(BaseFormatter):
     @staticmethod
     def _format_size(size_bytes: int) -> str:
         """Convert bytes to human readable format."""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        return ModuleDisplay.format_size(size_bytes)
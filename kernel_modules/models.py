@@ -11,6 +11,9 @@ from typing import List
 class KernelModule:
     """Represents a loaded kernel module with its properties."""
     
+    __slots__ = ('name', 'size', 'ref_count', 'dependencies', 'status', 'address',
+                 'module_type', 'file_path', 'description')
+    
     def __init__(self, name: str, size: int, ref_count: int, 
                  dependencies: List[str], status: str, address: str, 
                  module_type: str = "loadable", file_path: str = "", description: str = ""):
@@ -75,6 +78,8 @@ class KernelModule:
 class BuiltinModule:
     """Represents a builtin kernel module."""
     
+    __slots__ = ('name', 'description', 'version', 'author', 'license', 'module_type')
+    
     def __init__(self, name: str, description: str = "", version: str = "", 
                  author: str = "", license: str = ""):
         """
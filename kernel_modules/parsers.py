@@ -7,18 +7,99 @@ information including /proc/modules, modules.builtin, and modinfo output.
 
 import os
 import sys
+import mmap
 import subprocess
 import re
+import struct
 import zstandard as zstd
 import tempfile
-from typing import List, Set, Optional
+import functools
+from typing import FrozenSet, List, Set, Optional, Tuple
 from .models import KernelModule, BuiltinModule
 
-try:
-    from elftools.elf.elffile import ELFFile
-    ELF_TOOLS_AVAILABLE = True
-except ImportError:
-    ELF_TOOLS_AVAILABLE = False
+# A modinfo record starts at its filename: line, which for builtin modules
+# is directly preceded by the name: line
+_MODINFO_RECORD_RE = re.compile(rb'^(?:name:[^\n]*\n)?filename:', re.MULTILINE)
+_MODINFO_FIELD_RE = re.compile(
+    rb'^(name|filename|description|version|author|license):[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+
+# Field layout per ELF class (EI_CLASS): header size, e_shoff offset and format,
+# offset of e_shentsize/e_shnum/e_shstrndx, and the Shdr offsets of
+# sh_offset/sh_size (with their format) and sh_link
+_ELF_LAYOUTS = {
+    1: (0x34, 0x20, 'I', 0x2E, 0x10, 'II', 0x18),  # ELFCLASS32
+    2: (0x40, 0x28, 'Q', 0x3A, 0x18, 'QQ', 0x28),  # ELFCLASS64
+}
+
+
+def _find_modinfo_section(image) -> Optional[Tuple[int, int]]:
+    """
+    Locate the .modinfo section by walking the ELF section headers directly.
+    
+    Handles 32- and 64-bit images in either byte order.
+    
+    Args:
+        image: ELF image as bytes or an mmap
+        
+    Returns:
+        Optional[Tuple[int, int]]: (start, end) offsets of .modinfo, or None
+    """
+    if len(image) < 0x34 or image[:4] != b'\x7fELF':
+        return None
+    layout = _ELF_LAYOUTS.get(image[4])
+    if layout is None or image[5] not in (1, 2):
+        return None
+    ehdr_size, shoff_at, addr_fmt, shnum_at, sh_offset_at, offsets_fmt, sh_link_at = layout
+    if len(image) < ehdr_size:
+        return None
+    order = '<' if image[5] == 1 else '>'
+    
+    (e_shoff,) = struct.unpack_from(order + addr_fmt, image, shoff_at)
+    e_shentsize, e_shnum, e_shstrndx = struct.unpack_from(order + 'HHH', image, shnum_at)
+    if not e_shoff:
+        return None
+    
+    if e_shnum == 0:
+        # Extended numbering: the real count lives in section 0's sh_size
+        e_shnum = struct.unpack_from(order + offsets_fmt, image, e_shoff + sh_offset_at)[1]
+    if e_shstrndx == 0xffff:
+        (e_shstrndx,) = struct.unpack_from(order + 'I', image, e_shoff + sh_link_at)
+    if e_shstrndx >= e_shnum:
+        return None
+    
+    shstrtab_offset, _ = struct.unpack_from(
+        order + offsets_fmt, image, e_shoff + e_shstrndx * e_shentsize + sh_offset_at)
+    for index in range(e_shnum):
+        header = e_shoff + index * e_shentsize
+        (sh_name,) = struct.unpack_from(order + 'I', image, header)
+        name_offset = shstrtab_offset + sh_name
+        if image[name_offset:name_offset + 9] == b'.modinfo\x00':
+            sh_offset, sh_size = struct.unpack_from(order + offsets_fmt, image, header + sh_offset_at)
+            return sh_offset, sh_offset + sh_size
+    return None
+
+
+def _find_modinfo_value(image, start: int, end: int, key: bytes) -> Optional[bytes]:
+    """
+    Find the value of a "key=value" entry in the .modinfo range of an image.
+    
+    Entries are NUL-separated, so a match only counts at the start of an entry.
+    """
+    needle = key + b'='
+    pos = image.find(needle, start, end)
+    while pos >= 0:
+        if pos == start or image[pos - 1] == 0:
+            value_end = image.find(b'\x00', pos, end)
+            return image[pos + len(needle):value_end if value_end >= 0 else end]
+        pos = image.find(needle, pos + 1, end)
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _kernel_release() -> str:
+    """Return the running kernel release; it cannot change within a process."""
+    return os.uname().release
 
 
 class ModuleParser:
@@ -82,10 +163,38 @@ class ModuleParser:
         
         return modules
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop cached module lookups, e.g. after modules were (un)installed."""
+        cls._build_module_index.cache_clear()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _build_module_index() -> dict:
+        """
+        Index every module file under /lib/modules/{version} by module name.
+        
+        The tree is walked once per process; module names are normalized to
+        use underscores, matching how the kernel reports them in /proc/modules.
+        
+        Returns:
+            dict: Mapping of module name to full path of its .ko file
+        """
+        index = {}
+        modules_dir = f'/lib/modules/{_kernel_release()}'
+        
+        for root, _, files in os.walk(modules_dir):
+            for file_name in files:
+                if file_name.endswith(('.ko', '.ko.zst', '.ko.xz', '.ko.gz')):
+                    module_name = file_name.split('.ko')[0].replace('-', '_')
+                    index.setdefault(module_name, os.path.join(root, file_name))
+        
+        return index
+    
     @staticmethod
     def _get_module_file_path(module_name: str) -> str:
         """
-        Get the full file path of a kernel module using modinfo.
+        Get the full file path of a kernel module from the module index.
         
         Args:
             module_name: Name of the module
@@ -93,13 +202,7 @@ class ModuleParser:
         Returns:
             str: Full path to the module file, or empty string if not found
         """
-        try:
-            result = subprocess.run(['modinfo', '-n', module_name], 
-                                  capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            # modinfo might not be available or module might not have a file
-            return ""
+        return ModuleParser._build_module_index().get(module_name.replace('-', '_'), "")
     
     @staticmethod
     def _get_module_description(module_name: str) -> str:
@@ -117,19 +220,20 @@ class ModuleParser:
         if not file_path:
             return ""
         
-        # Try ELF parsing first if available
-        if ELF_TOOLS_AVAILABLE:
-            description = ModuleParser._extract_description_from_elf(file_path)
-            if description:
-                return description
+        # Try reading the .modinfo strings straight from the module file first
+        description = ModuleParser._extract_description_from_elf(file_path)
+        if description:
+            return description
         
-        # Fallback to modinfo if ELF parsing fails or is not available
+        # Fallback to modinfo if the module file could not be read
         try:
-            result = subprocess.run(['modinfo', '-F', 'description', module_name], 
-                                  capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except (subprocess.CalledProcessError, FileNotFoundError):
+            result = subprocess.run(['modinfo', '-F', 'description', module_name],
+                                  stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False)
+        except FileNotFoundError:
+            return ""
+        if result.returncode != 0:
             return ""
+        return result.stdout.decode('utf-8', 'replace').strip()
     
     @staticmethod
     def _extract_description_from_elf(file_path: str) -> str:
@@ -157,6 +261,10 @@ class ModuleParser:
         """
         Extract description from uncompressed ELF file.
         
+        The file is memory-mapped, the .modinfo section is located from the
+        section headers and only that range is searched for the first
+        ``description=`` entry. Only the pages actually touched are read in.
+        
         Args:
             file_path: Path to the .ko file
             
@@ -164,20 +272,13 @@ class ModuleParser:
             str: Module description, or empty string if not found
         """
         try:
-            with open(file_path, 'rb') as f:
-                elf = ELFFile(f)
-                modinfo_section = elf.get_section_by_name('.modinfo')
-                if not modinfo_section:
+            with open(file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                section = _find_modinfo_section(mm)
+                if section is None:
                     return ""
-                
-                modinfo_data = modinfo_section.data()
-                modinfo_strings = modinfo_data.split(b'\x00')
-                
-                for entry in modinfo_strings:
-                    if entry.startswith(b'description='):
-                        return entry.split(b'=', 1)[1].decode('utf-8', errors='ignore')
-                
-                return ""
+                value = _find_modinfo_value(mm, section[0], section[1], b'description')
+                return value.decode('utf-8', errors='ignore') if value is not None else ""
         except Exception as e:
             print(f"Warning: Error reading ELF file {file_path}: {e}", file=sys.stderr)
             return ""
@@ -219,13 +320,23 @@ class ModuleParser:
 class BuiltinModuleParser:
     """Parser for builtin kernel modules from various sources."""
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop cached builtin/loadable module lookups."""
+        cls.get_loadable_module_names.cache_clear()
+        cls.get_builtin_modules_from_modules_builtin.cache_clear()
+        cls.get_builtin_modules_from_modinfo.cache_clear()
+    
     @staticmethod
-    def get_loadable_module_names() -> Set[str]:
+    @functools.lru_cache(maxsize=1)
+    def get_loadable_module_names() -> FrozenSet[str]:
         """
         Get names of currently loaded modules from /proc/modules.
         
+        The result is cached; call clear_cache() to re-read /proc/modules.
+        
         Returns:
-            Set[str]: Set of currently loaded module names
+            FrozenSet[str]: Set of currently loaded module names
         """
         loadable_modules = set()
         
@@ -239,96 +350,92 @@ class BuiltinModuleParser:
         except Exception:
             pass
         
-        return loadable_modules
+        return frozenset(loadable_modules)
     
-    @staticmethod
-    def get_builtin_modules_from_modules_builtin() -> Set[str]:
+    @classmethod
+    @functools.lru_cache(maxsize=1)
+    def get_builtin_modules_from_modules_builtin(cls) -> FrozenSet[str]:
         """
         Extract builtin module names from /lib/modules/{version}/modules.builtin.
         
         This is the authoritative source for builtin modules as per kernel documentation:
         https://www.kernel.org/doc/html/latest/kbuild/kbuild.html#modules-builtin
         
+        Currently loaded modules are subtracted while reading, so callers get
+        the final builtin set without a separate pass.
+        
         Returns:
-            Set[str]: Set of builtin module names from modules.builtin file
+            FrozenSet[str]: Set of builtin module names from modules.builtin file
         """
         builtin_modules = set()
         
         try:
-            kernel_version = os.uname().release
+            kernel_version = _kernel_release()
             modules_builtin_path = f'/lib/modules/{kernel_version}/modules.builtin'
             
             if os.path.exists(modules_builtin_path):
+                loadable_modules = cls.get_loadable_module_names()
                 with open(modules_builtin_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line:
-                            # Extract module name from path like "kernel/fs/ext4/ext4.ko"
-                            module_name = os.path.basename(line).replace('.ko', '')
-                            builtin_modules.add(module_name)
+                    # Entries are paths like "kernel/fs/ext4/ext4.ko"
+                    builtin_modules = {
+                        entry.rsplit('/', 1)[-1][:-3]
+                        for line in f if (entry := line.strip())
+                    } - loadable_modules
             else:
                 print(f"Warning: {modules_builtin_path} not found", file=sys.stderr)
                 
         except Exception as e:
             print(f"Warning: Error reading modules.builtin: {e}", file=sys.stderr)
         
-        return builtin_modules
+        return frozenset(builtin_modules)
     
     @staticmethod
-    def get_builtin_modules_from_modinfo() -> List[BuiltinModule]:
+    @functools.lru_cache(maxsize=1)
+    def get_builtin_modules_from_modinfo() -> Tuple[BuiltinModule, ...]:
         """
         Get builtin module information using modinfo command.
         
+        'modinfo -a' takes seconds on a typical system, so the result is
+        cached for the lifetime of the process.
+        
         Returns:
-            List[BuiltinModule]: List of builtin modules with metadata
+            Tuple[BuiltinModule, ...]: Builtin modules with metadata
         """
         builtin_modules = []
         
         try:
             # Get list of all available modules (including builtin)
-            result = subprocess.run(['modinfo', '-a'], capture_output=True, text=True, check=True)
-            
-            # Parse modinfo output to find builtin modules
-            current_module = None
-            module_info = {}
+            result = subprocess.run(['modinfo', '-a'], stdout=subprocess.PIPE,
+                                  stderr=subprocess.DEVNULL, check=False)
+            if result.returncode != 0:
+                # modinfo might fail, e.g. when no module names are given
+                return ()
             
-            for line in result.stdout.split('\n'):
-                if line.startswith('filename:'):
-                    # Extract module name from filename
-                    filename = line.split(':', 1)[1].strip()
-                    if filename == '(builtin)':
-                        # This is a builtin module
-                        if current_module:
-                            builtin_modules.append(BuiltinModule(
-                                name=current_module,
-                                description=module_info.get('description', ''),
-                                version=module_info.get('version', ''),
-                                author=module_info.get('author', ''),
-                                license=module_info.get('license', '')
-                            ))
-                        current_module = None
-                        module_info = {}
-                    elif filename.endswith('.ko'):
-                        # This is a loadable module, skip
-                        current_module = None
-                        module_info = {}
-                    else:
-                        # This might be a builtin module
-                        current_module = filename.split('/')[-1] if '/' in filename else filename
-                elif current_module and ':' in line:
-                    key, value = line.split(':', 1)
-                    module_info[key.strip()] = value.strip()
+            # Slice the output into per-module records and pull the fields
+            # out of each record with a single regex pass
+            blob = result.stdout
+            starts = [m.start() for m in _MODINFO_RECORD_RE.finditer(blob)]
+            for start, end in zip(starts, starts[1:] + [len(blob)]):
+                fields = {}
+                for key, value in _MODINFO_FIELD_RE.findall(blob, start, end):
+                    fields.setdefault(key, value)
+                if fields.get(b'filename') != b'(builtin)' or not fields.get(b'name'):
+                    continue
+                builtin_modules.append(BuiltinModule(
+                    name=fields[b'name'].decode('utf-8', 'replace'),
+                    description=fields.get(b'description', b'').decode('utf-8', 'replace'),
+                    version=fields.get(b'version', b'').decode('utf-8', 'replace'),
+                    author=fields.get(b'author', b'').decode('utf-8', 'replace'),
+                    license=fields.get(b'license', b'').decode('utf-8', 'replace')
+                ))
                     
-        except subprocess.CalledProcessError:
-            # modinfo might not be available or might fail
-            pass
         except FileNotFoundError:
             # modinfo command not found
             pass
         except Exception as e:
             print(f"Warning: Error running modinfo: {e}", file=sys.stderr)
         
-        return builtin_modules
+        return tuple(builtin_modules)
     
     @staticmethod
     def get_builtin_modules_from_config() -> Set[str]:
@@ -345,7 +452,7 @@ class BuiltinModuleParser:
         # Try different config file locations
         config_paths = [
             '/proc/config.gz',
-            f'/boot/config-{os.uname().release}',
+            f'/boot/config-{_kernel_release()}',
             '/boot/config'
         ]
         
@@ -387,7 +494,7 @@ class BuiltinModuleParser:
         """
         try:
             # Try to find the module source file
-            kernel_version = os.uname().release
+            kernel_version = _kernel_release()
             possible_paths = [
                 f'/lib/modules/{kernel_version}/source',
                 f'/lib/modules/{kernel_version}/build',
@@ -483,7 +590,7 @@ class BuiltinModuleParser:
         module_metadata = {}
         
         try:
-            kernel_version = os.uname().release
+            kernel_version = _kernel_release()
             modinfo_path = f'/lib/modules/{kernel_version}/modules.builtin.modinfo'
             
             if os.path.exists(modinfo_path):
@@ -559,7 +666,7 @@ class BuiltinModuleParser:
         """
         try:
             # Try to find the module source file
-            kernel_version = os.uname().release
+            kernel_version = _kernel_release()
             possible_paths = [
                 f'/lib/modules/{kernel_version}/source',
                 f'/lib/modules/{kernel_version}/build',
@@ -629,6 +736,11 @@ class BuiltinModuleParser:
         # Get currently loaded modules to exclude them from builtin detection
         loadable_modules = cls.get_loadable_module_names()
         
+        # Detailed module info from modinfo, used both as a fallback source of
+        # names and for metadata; modinfo is slow, so run it only once
+        modinfo_modules = cls.get_builtin_modules_from_modinfo()
+        modinfo_by_name = {module.name: module for module in modinfo_modules}
+        
         # Primary method: Use modules.builtin file (authoritative source)
         modules_builtin = cls.get_builtin_modules_from_modules_builtin()
         module_names.update(modules_builtin)
@@ -637,19 +749,14 @@ class BuiltinModuleParser:
         if not module_names:
             print("Warning: modules.builtin not found, using fallback methods", file=sys.stderr)
             config_modules = cls.get_builtin_modules_from_config()
-            modinfo_modules = cls.get_builtin_modules_from_modinfo()
             
             # Combine fallback module names
             module_names.update(config_modules)
-            module_names.update(module.name for module in modinfo_modules)
+            module_names.update(modinfo_by_name)
             
             # Remove loadable modules from builtin detection to avoid false positives
             module_names = module_names - loadable_modules
         
-        # Get detailed module info from modinfo for builtin modules
-        modinfo_modules = cls.get_builtin_modules_from_modinfo()
-        modinfo_names = {module.name for module in modinfo_modules}
-        
         # Get license information from kernel binary
         kernel_licenses = cls._extract_license_from_kernel_binary()
         
@@ -659,9 +766,17 @@ class BuiltinModuleParser:
         # Create BuiltinModule objects
         for name in module_names:
             # Check if we have detailed info from modinfo
-            existing_module = next((m for m in modinfo_modules if m.name == name), None)
+            existing_module = modinfo_by_name.get(name)
             if existing_module:
-                builtin_modules.append(existing_module)
+                # The modinfo result is cached; hand out a copy so callers
+                # cannot mutate the shared instance
+                builtin_modules.append(BuiltinModule(
+                    name=existing_module.name,
+                    description=existing_module.description,
+                    version=existing_module.version,
+                    author=existing_module.author,
+                    license=existing_module.license
+                ))
             else:
                 # Try to get metadata from modules.builtin.modinfo first
                 description = ""
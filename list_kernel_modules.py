@@ -13,18 +13,20 @@ import subprocess
 import re
 import json
 import csv
+import datetime
 import fnmatch
-import tempfile
-import atexit
-import shutil
-import glob
-from typing import List, Dict, Optional, Set, Union
-
-try:
-    from elftools.elf.elffile import ELFFile
-    ELF_TOOLS_AVAILABLE = True
-except ImportError:
-    ELF_TOOLS_AVAILABLE = False
+import gzip
+import html
+import io
+import mmap
+import operator
+import platform
+import struct
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import List, Dict, Iterator, Mapping, Optional, Set, Tuple, Union
 
 try:
     import zstandard as zstd
@@ -32,35 +34,30 @@ try:
 except ImportError:
     ZSTD_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Managed temporary working directory for .ko.zst decompression
-_TEMP_WORK_DIR: Optional[str] = None
-
-
-def _ensure_temp_work_dir() -> str:
-    """Create a dedicated temp directory under /tmp once per run and register cleanup."""
-    global _TEMP_WORK_DIR
-    if _TEMP_WORK_DIR is None:
-        _TEMP_WORK_DIR = tempfile.mkdtemp(prefix='kmod_tmp_')
 
-        def _cleanup_tmp_dir():
-            try:
-                if _TEMP_WORK_DIR and os.path.exists(_TEMP_WORK_DIR):
-                    shutil.rmtree(_TEMP_WORK_DIR, ignore_errors=True)
-            except Exception:
-                pass
+# Worker count for concurrent per-module file reads (I/O bound, so oversubscribe CPUs)
+_MAX_IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-        atexit.register(_cleanup_tmp_dir)
-    return _TEMP_WORK_DIR
+# Per-thread zstd decompressor, see _decompress_zst()
+_ZSTD_LOCAL = threading.local()
 
 
 class KernelModule:
     """Represents a loaded kernel module with its properties."""
     
+    __slots__ = ('name', 'size', 'ref_count', 'dependencies', 'status', 'address',
+                 'module_type', 'file_path', '_description', '_signed')
+    
     def __init__(self, name: str, size: int, ref_count: int, 
                  dependencies: List[str], status: str, address: str, 
-                 module_type: str = "loadable", file_path: str = "", description: str = "",
-                 signed: str = ""):
+                 module_type: str = "loadable", file_path: str = "",
+                 description: Optional[str] = None, signed: Optional[str] = None):
         self.name = name
         self.size = size
         self.ref_count = ref_count
@@ -69,8 +66,37 @@ class KernelModule:
         self.address = address
         self.module_type = module_type
         self.file_path = file_path
-        self.description = description
-        self.signed = signed
+        # Unless given, description and signed are read from the module file
+        # on first access (or preloaded in bulk by load_module_metadata())
+        self._description = description
+        self._signed = signed
+    
+    @property
+    def description(self) -> str:
+        """
+        Module description, read from the module file on first access.
+        
+        Only the module file is read here; the modinfo fallback for unreadable
+        files forks a process, so it is left to load_module_metadata().
+        """
+        if self._description is None:
+            self._description = extract_description_from_elf(self.file_path) if self.file_path else ""
+        return self._description
+    
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
+    
+    @property
+    def signed(self) -> str:
+        """Signature state ('Yes', 'No' or 'Unknown'), read on first access."""
+        if self._signed is None:
+            self._signed = _signed_state(self.file_path)
+        return self._signed
+    
+    @signed.setter
+    def signed(self, value: str) -> None:
+        self._signed = value
     
     def __str__(self) -> str:
         deps_str = ", ".join(self.dependencies) if self.dependencies else "None"
@@ -89,6 +115,8 @@ class KernelModule:
 class BuiltinModule:
     """Represents a builtin kernel module."""
     
+    __slots__ = ('name', 'description', 'version', 'author', 'license', 'module_type')
+    
     def __init__(self, name: str, description: str = "", version: str = "", 
                  author: str = "", license: str = ""):
         self.name = name
@@ -106,24 +134,11 @@ class BuiltinModule:
                 f"  License: {self.license}\n")
 
 
-def get_builtin_modules_from_kallsyms() -> Set[str]:
-    """
-    Extract builtin module names from /proc/kallsyms.
-    
-    This method is not reliable for detecting builtin modules as loadable modules
-    also appear in kallsyms. This function is kept for completeness but should
-    not be used as the primary detection method.
-    
-    Returns:
-        Set[str]: Set of builtin module names found in kallsyms
-        
-    Raises:
-        FileNotFoundError: If /proc/kallsyms doesn't exist
-        PermissionError: If unable to read /proc/kallsyms
-    """
-    # This method is unreliable - loadable modules also appear in kallsyms
-    # We'll return an empty set to avoid false positives
-    return set()
+# A modinfo record starts at its filename: line, which for builtin modules
+# is directly preceded by the name: line
+_MODINFO_RECORD_RE = re.compile(rb'^(?:name:[^\n]*\n)?filename:', re.MULTILINE)
+_MODINFO_FIELD_RE = re.compile(
+    rb'^(name|filename|description|version|author|license):[ \t]*(.*?)[ \t]*$', re.MULTILINE)
 
 
 def get_builtin_modules_from_modinfo() -> List[BuiltinModule]:
@@ -137,42 +152,30 @@ def get_builtin_modules_from_modinfo() -> List[BuiltinModule]:
     
     try:
         # Get list of all available modules (including builtin)
-        result = subprocess.run(['modinfo', '-a'], capture_output=True, text=True, check=True)
-        
-        # Parse modinfo output to find builtin modules
-        current_module = None
-        module_info = {}
+        result = subprocess.run(['modinfo', '-a'], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, check=False)
+        if result.returncode != 0:
+            # modinfo might fail, e.g. when no module names are given
+            return builtin_modules
         
-        for line in result.stdout.split('\n'):
-            if line.startswith('filename:'):
-                # Extract module name from filename
-                filename = line.split(':', 1)[1].strip()
-                if filename == '(builtin)':
-                    # This is a builtin module
-                    if current_module:
-                        builtin_modules.append(BuiltinModule(
-                            name=current_module,
-                            description=module_info.get('description', ''),
-                            version=module_info.get('version', ''),
-                            author=module_info.get('author', ''),
-                            license=module_info.get('license', '')
-                        ))
-                    current_module = None
-                    module_info = {}
-                elif filename.endswith('.ko'):
-                    # This is a loadable module, skip
-                    current_module = None
-                    module_info = {}
-                else:
-                    # This might be a builtin module
-                    current_module = filename.split('/')[-1] if '/' in filename else filename
-            elif current_module and ':' in line:
-                key, value = line.split(':', 1)
-                module_info[key.strip()] = value.strip()
+        # Slice the output into per-module records and pull the fields
+        # out of each record with a single regex pass
+        blob = result.stdout
+        starts = [m.start() for m in _MODINFO_RECORD_RE.finditer(blob)]
+        for start, end in zip(starts, starts[1:] + [len(blob)]):
+            fields = {}
+            for key, value in _MODINFO_FIELD_RE.findall(blob, start, end):
+                fields.setdefault(key, value)
+            if fields.get(b'filename') != b'(builtin)' or not fields.get(b'name'):
+                continue
+            builtin_modules.append(BuiltinModule(
+                name=fields[b'name'].decode('utf-8', 'replace'),
+                description=fields.get(b'description', b'').decode('utf-8', 'replace'),
+                version=fields.get(b'version', b'').decode('utf-8', 'replace'),
+                author=fields.get(b'author', b'').decode('utf-8', 'replace'),
+                license=fields.get(b'license', b'').decode('utf-8', 'replace')
+            ))
                 
-    except subprocess.CalledProcessError:
-        # modinfo might not be available or might fail
-        pass
     except FileNotFoundError:
         # modinfo command not found
         pass
@@ -237,6 +240,10 @@ def get_builtin_modules_from_modules_builtin() -> Set[str]:
     return builtin_modules
 
 
+# Kernel config entries of the form CONFIG_<NAME>_BUILTIN=y
+_BUILTIN_RE = re.compile(rb'CONFIG_([A-Z0-9_]+)_BUILTIN=y')
+
+
 def get_builtin_modules_from_config() -> Set[str]:
     """
     Extract builtin module names from kernel configuration files.
@@ -258,22 +265,15 @@ def get_builtin_modules_from_config() -> Set[str]:
     for config_path in config_paths:
         if os.path.exists(config_path):
             try:
-                if config_path.endswith('.gz'):
-                    import gzip
-                    with gzip.open(config_path, 'rt') as f:
-                        content = f.read()
-                else:
-                    with open(config_path, 'r') as f:
-                        content = f.read()
-                
-                # Look for CONFIG_*_BUILTIN=y patterns
-                for line in content.split('\n'):
-                    if '=y' in line and 'CONFIG_' in line and 'BUILTIN' in line:
+                # Stream the config line by line; config.gz is decompressed
+                # on the fly instead of being read into memory first
+                opener = gzip.open if config_path.endswith('.gz') else open
+                with opener(config_path, 'rb') as f:
+                    for line in f:
                         # Extract module name from CONFIG_MODULE_NAME_BUILTIN=y
-                        match = re.search(r'CONFIG_([A-Z0-9_]+)_BUILTIN=y', line)
+                        match = _BUILTIN_RE.match(line)
                         if match:
-                            module_name = match.group(1).lower().replace('_', '')
-                            builtin_modules.add(module_name)
+                            builtin_modules.add(match.group(1).lower().replace(b'_', b'').decode())
                             
             except Exception as e:
                 print(f"Warning: Error reading {config_path}: {e}", file=sys.stderr)
@@ -305,12 +305,10 @@ def get_all_builtin_modules() -> List[BuiltinModule]:
     # Fallback methods (only if modules.builtin is not available)
     if not module_names:
         print("Warning: modules.builtin not found, using fallback methods", file=sys.stderr)
-        kallsyms_modules = get_builtin_modules_from_kallsyms()
         config_modules = get_builtin_modules_from_config()
         modinfo_modules = get_builtin_modules_from_modinfo()
         
         # Combine fallback module names
-        module_names.update(kallsyms_modules)
         module_names.update(config_modules)
         module_names.update(module.name for module in modinfo_modules)
         
@@ -380,8 +378,7 @@ def parse_modules_builtin_modinfo() -> Dict[str, Dict[str, str]]:
                 name = current.get('name') or current.get('module') or current.get('filename')
                 # Derive name from filename if needed
                 if name and '/' in name:
-                    import os as _os
-                    base = _os.path.basename(name)
+                    base = os.path.basename(name)
                     name = base.replace('.ko', '')
                 if name and name not in result:
                     result[name] = {
@@ -446,6 +443,15 @@ def parse_modules_builtin_modinfo() -> Dict[str, Dict[str, str]]:
     return result
 
 
+# Bytes that end a printable string: anything but ASCII printable and tab
+_NON_PRINTABLE_RE = re.compile(rb'[^\t\x20-\x7e]')
+
+
+def _is_printable_byte(b: int) -> bool:
+    # ASCII printable range and common whitespace separators
+    return (32 <= b <= 126) or b in (9,)
+
+
 def _extract_descriptions_via_strings(file_path: str) -> Dict[str, str]:
     """Extract descriptions for builtin modules by scanning printable strings.
     Looks for tokens like '<name>.description=<text>' without using external tools.
@@ -456,49 +462,83 @@ def _extract_descriptions_via_strings(file_path: str) -> Dict[str, str]:
     except Exception:
         return {}
 
-    def is_printable_byte(b: int) -> bool:
-        # ASCII printable range and common whitespace separators
-        return (32 <= b <= 126) or b in (9,)
-
-    strings: List[str] = []
-    buf: List[int] = []
-    min_len = 3
-    for b in data:
-        if is_printable_byte(b):
-            buf.append(b)
-        else:
-            if len(buf) >= min_len:
-                try:
-                    strings.append(bytes(buf).decode('utf-8', errors='ignore'))
-                except Exception:
-                    pass
-            buf = []
-    if len(buf) >= min_len:
+    # Only the printable run around each '.description=' match is decoded;
+    # everything else in the file is skipped by C-level searches
+    desc_map: Dict[str, str] = {}
+    pos = data.find(b'.description=')
+    while pos >= 0:
+        start = pos
+        while start > 0 and _is_printable_byte(data[start - 1]):
+            start -= 1
+        end_match = _NON_PRINTABLE_RE.search(data, pos)
+        end = end_match.start() if end_match else len(data)
+        
+        s = data[start:end].decode('utf-8', errors='ignore')
+        # Simple pattern match: <name>.description=<value>
         try:
-            strings.append(bytes(buf).decode('utf-8', errors='ignore'))
+            left, right = s.split('.description=', 1)
+            name = left.split()[-1] if ' ' in left else left
+            name = name.strip().strip('"\'')
+            value = right.strip().strip('"\'')
+            # normalize name if it looks like a path
+            if '/' in name:
+                name = os.path.basename(name).replace('.ko', '')
+            if name and value and name not in desc_map:
+                desc_map[name] = value
         except Exception:
             pass
-
-    desc_map: Dict[str, str] = {}
-    for s in strings:
-        # Simple pattern match: <name>.description=<value>
-        if '.description=' in s:
-            try:
-                left, right = s.split('.description=', 1)
-                name = left.split()[-1] if ' ' in left else left
-                name = name.strip().strip('"\'')
-                value = right.strip().strip('"\'')
-                # normalize name if it looks like a path
-                if '/' in name:
-                    import os as _os
-                    name = _os.path.basename(name).replace('.ko', '')
-                if name and value and name not in desc_map:
-                    desc_map[name] = value
-            except Exception:
-                continue
+        
+        pos = data.find(b'.description=', end)
     return desc_map
 
 
+def _batch_modinfo_field(names: List[str], field: str) -> Dict[str, str]:
+    """
+    Look up one modinfo field for many modules with a single modinfo process.
+    
+    'modinfo -F' prints nothing for modules lacking the field, so its output
+    cannot be matched back to the names; full records are parsed instead.
+    
+    Args:
+        names: Module names to query
+        field: modinfo field to extract (e.g. 'description')
+        
+    Returns:
+        Dict[str, str]: Mapping of module name (with underscores) to field value
+    """
+    values: Dict[str, str] = {}
+    if not names:
+        return values
+    
+    try:
+        # Unknown modules only produce an error on stderr, so the exit
+        # status is ignored and whatever records were printed are used
+        result = subprocess.run(['modinfo', *names], stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, check=False)
+    except OSError:
+        # modinfo command not found
+        return values
+    
+    # Lines are split as raw bytes; only the values that are kept get decoded
+    field_key = field.encode()
+    current = None
+    for line in result.stdout.splitlines():
+        key, sep, value = line.partition(b':')
+        if not sep:
+            continue
+        value = value.strip()
+        if key == b'filename':
+            # Each record starts with its filename; builtins print name: first
+            if not value.startswith(b'('):
+                current = os.path.basename(value).split(b'.ko')[0].replace(b'-', b'_').decode('utf-8', 'replace')
+        elif key == b'name':
+            current = value.replace(b'-', b'_').decode('utf-8', 'replace')
+        elif key == field_key and current and current not in values:
+            values[current] = value.decode('utf-8', 'replace')
+    
+    return values
+
+
 def get_description_via_modinfo(module_name: str) -> str:
     return ''
 
@@ -516,7 +556,6 @@ def deduplicate_license(license_str: str) -> str:
         return ''
     cleaned = ' '.join(license_str.split())  # collapse whitespace
     # If multiple entries separated by , ; |
-    import re
     parts = [p.strip() for p in re.split(r"[;,|]+", cleaned) if p.strip()]
     if not parts:
         return cleaned
@@ -529,53 +568,49 @@ def deduplicate_license(license_str: str) -> str:
     return ', '.join(unique_parts)
 
 
-def get_module_file_path(module_name: str) -> str:
+@functools.lru_cache(maxsize=1)
+def _load_modules_dep_index() -> Dict[str, str]:
     """
-    Get the full file path of a kernel module using modinfo.
+    Map module names to module file paths using /lib/modules/<version>/modules.dep.
+    
+    depmod already lists every installed module there, so one sequential read
+    replaces a modinfo fork per module. Names are normalized to underscores,
+    the form the kernel uses in /proc/modules.
     
-    Args:
-        module_name: Name of the module
-        
     Returns:
-        str: Full path to the module file, or empty string if not found
+        Dict[str, str]: Mapping of module name to absolute module file path
     """
+    index: Dict[str, str] = {}
+    modules_dir = f'/lib/modules/{os.uname().release}'
+    
     try:
-        result = subprocess.run(['modinfo', '-n', module_name], 
-                              capture_output=True, text=True, check=True)
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        # modinfo might not be available or module might not have a file
-        return ""
+        with open(f'{modules_dir}/modules.dep', 'r') as f:
+            for line in f:
+                # Format: "kernel/fs/ext4/ext4.ko.zst: kernel/fs/mbcache.ko.zst ..."
+                rel_path = line.split(':', 1)[0].strip()
+                if not rel_path:
+                    continue
+                name = os.path.basename(rel_path).split('.ko')[0].replace('-', '_')
+                full_path = rel_path if rel_path.startswith('/') else f'{modules_dir}/{rel_path}'
+                index.setdefault(name, full_path)
+    except OSError:
+        # No modules.dep (e.g. in containers); paths are simply left unknown
+        pass
+    
+    return index
 
 
-def get_module_description(module_name: str) -> str:
+def get_module_file_path(module_name: str) -> str:
     """
-    Get the description of a kernel module by parsing the ELF file.
+    Get the full file path of a kernel module from the modules.dep index.
     
     Args:
         module_name: Name of the module
         
     Returns:
-        str: Module description, or empty string if not found
+        str: Full path to the module file, or empty string if not found
     """
-    # First try to get the file path
-    file_path = get_module_file_path(module_name)
-    if not file_path:
-        return ""
-    
-    # Try ELF parsing first if available
-    if ELF_TOOLS_AVAILABLE:
-        description = extract_description_from_elf(file_path)
-        if description:
-            return description
-    
-    # Fallback to modinfo if ELF parsing fails or is not available
-    try:
-        result = subprocess.run(['modinfo', '-F', 'description', module_name], 
-                              capture_output=True, text=True, check=True)
-        return result.stdout.strip()
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return ""
+    return _load_modules_dep_index().get(module_name.replace('-', '_'), "")
 
 
 def extract_description_from_elf(file_path: str) -> str:
@@ -610,66 +645,137 @@ def extract_from_elf_file(file_path: str) -> str:
         str: Module description, or empty string if not found
     """
     try:
-        with open(file_path, 'rb') as f:
-            elf = ELFFile(f)
-            modinfo_section = elf.get_section_by_name('.modinfo')
-            if not modinfo_section:
-                return ""
-            
-            modinfo_data = modinfo_section.data()
-            modinfo_strings = modinfo_data.split(b'\x00')
-            
-            for entry in modinfo_strings:
-                if entry.startswith(b'description='):
-                    return entry.split(b'=', 1)[1].decode('utf-8', errors='ignore')
-            
-            return ""
+        with open(file_path, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _extract_description_from_image(mm)
     except Exception as e:
         print(f"Warning: Error reading ELF file {file_path}: {e}", file=sys.stderr)
         return ""
 
 
-def _elf_has_signature_info(file_path: str) -> bool:
+# Field layout per ELF class (EI_CLASS): header size, e_shoff offset and format,
+# offset of e_shentsize/e_shnum/e_shstrndx, and the Shdr offsets of
+# sh_offset/sh_size (with their format) and sh_link
+_ELF_LAYOUTS = {
+    1: (0x34, 0x20, 'I', 0x2E, 0x10, 'II', 0x18),  # ELFCLASS32
+    2: (0x40, 0x28, 'Q', 0x3A, 0x18, 'QQ', 0x28),  # ELFCLASS64
+}
+
+
+def _find_modinfo_section(image) -> Optional[Tuple[int, int]]:
+    """
+    Locate the .modinfo section by walking the ELF section headers directly.
+    
+    Handles 32- and 64-bit images in either byte order.
+    
+    Args:
+        image: ELF image as bytes or an mmap
+        
+    Returns:
+        Optional[Tuple[int, int]]: (start, end) offsets of .modinfo, or None
+    """
+    if len(image) < 0x34 or image[:4] != b'\x7fELF':
+        return None
+    layout = _ELF_LAYOUTS.get(image[4])
+    if layout is None or image[5] not in (1, 2):
+        return None
+    ehdr_size, shoff_at, addr_fmt, shnum_at, sh_offset_at, offsets_fmt, sh_link_at = layout
+    if len(image) < ehdr_size:
+        return None
+    order = '<' if image[5] == 1 else '>'
+    
+    (e_shoff,) = struct.unpack_from(order + addr_fmt, image, shoff_at)
+    e_shentsize, e_shnum, e_shstrndx = struct.unpack_from(order + 'HHH', image, shnum_at)
+    if not e_shoff:
+        return None
+    
+    if e_shnum == 0:
+        # Extended numbering: the real count lives in section 0's sh_size
+        e_shnum = struct.unpack_from(order + offsets_fmt, image, e_shoff + sh_offset_at)[1]
+    if e_shstrndx == 0xffff:
+        (e_shstrndx,) = struct.unpack_from(order + 'I', image, e_shoff + sh_link_at)
+    if e_shstrndx >= e_shnum:
+        return None
+    
+    shstrtab_offset, _ = struct.unpack_from(
+        order + offsets_fmt, image, e_shoff + e_shstrndx * e_shentsize + sh_offset_at)
+    for index in range(e_shnum):
+        header = e_shoff + index * e_shentsize
+        (sh_name,) = struct.unpack_from(order + 'I', image, header)
+        name_offset = shstrtab_offset + sh_name
+        if image[name_offset:name_offset + 9] == b'.modinfo\x00':
+            sh_offset, sh_size = struct.unpack_from(order + offsets_fmt, image, header + sh_offset_at)
+            return sh_offset, sh_offset + sh_size
+    return None
+
+
+def _find_modinfo_value(image, start: int, end: int, key: bytes) -> Optional[bytes]:
+    """
+    Find the value of a "key=value" entry in the .modinfo range of an image.
+    
+    Entries are NUL-separated, so a match only counts at the start of an entry.
+    """
+    needle = key + b'='
+    pos = image.find(needle, start, end)
+    while pos >= 0:
+        if pos == start or image[pos - 1] == 0:
+            value_end = image.find(b'\x00', pos, end)
+            return image[pos + len(needle):value_end if value_end >= 0 else end]
+        pos = image.find(needle, pos + 1, end)
+    return None
+
+
+def _extract_description_from_image(image) -> str:
+    """
+    Extract description from an in-memory or memory-mapped ELF image.
+    
+    Args:
+        image: ELF image as bytes or an mmap
+        
+    Returns:
+        str: Module description, or empty string if not found
+    """
+    section = _find_modinfo_section(image)
+    if section is None:
+        return ""
+    
+    value = _find_modinfo_value(image, section[0], section[1], b'description')
+    return value.decode('utf-8', errors='ignore') if value is not None else ""
+
+
+# .modinfo keys present for signed modules
+_SIGNATURE_KEYS = (b'sig_id', b'signer', b'signature', b'sig_key', b'sig_hashalgo')
+
+
+def _image_has_signature(image) -> bool:
     """
-    Check for signature-related keys in the ELF .modinfo section.
-    Returns True if keys like sig_id/signature/signer are present.
+    Check an ELF image for signature-related .modinfo keys or for the
+    "~Module signature appended~" marker near the end of the image.
+    
+    Args:
+        image: ELF image as bytes or an mmap
     """
-    try:
-        with open(file_path, 'rb') as f:
-            elf = ELFFile(f)
-            modinfo_section = elf.get_section_by_name('.modinfo')
-            if not modinfo_section:
-                return False
-            modinfo_data = modinfo_section.data()
-            modinfo_strings = modinfo_data.split(b'\x00')
-            for entry in modinfo_strings:
-                # Common keys present for signed modules
-                if (entry.startswith(b'sig_id=') or
-                    entry.startswith(b'signer=') or
-                    entry.startswith(b'signature=') or
-                    entry.startswith(b'sig_key=') or
-                    entry.startswith(b'sig_hashalgo=')):
-                    return True
-    except Exception:
-        return False
-    return False
+    section = _find_modinfo_section(image)
+    if section is not None and any(
+            _find_modinfo_value(image, section[0], section[1], key) is not None
+            for key in _SIGNATURE_KEYS):
+        return True
+    return image.find(b'Module signature appended', max(0, len(image) - 8192)) >= 0
 
 
-def _file_has_appended_signature_marker(file_path: str) -> bool:
+def _decompress_zst(file_path: str) -> bytes:
     """
-    Check for the textual marker that appears in signed modules:
-    "~Module signature appended~" near the end of the file.
+    Decompress a .ko.zst module into memory.
+    
+    Decompressor contexts are not thread-safe, so one is kept per thread
+    and reused across modules.
     """
-    try:
-        with open(file_path, 'rb') as f:
-            f.seek(0, os.SEEK_END)
-            size = f.tell()
-            read_size = min(8192, size)
-            f.seek(size - read_size)
-            tail = f.read(read_size)
-            return b'Module signature appended' in tail
-    except Exception:
-        return False
+    dctx = getattr(_ZSTD_LOCAL, 'dctx', None)
+    if dctx is None:
+        dctx = _ZSTD_LOCAL.dctx = zstd.ZstdDecompressor()
+    with open(file_path, 'rb') as compressed_file:
+        with dctx.stream_reader(compressed_file) as reader:
+            return reader.read()
 
 
 def is_module_signed_from_file(file_path: str) -> Optional[bool]:
@@ -681,37 +787,18 @@ def is_module_signed_from_file(file_path: str) -> Optional[bool]:
     if not file_path:
         return None
     try:
-        # If compressed, decompress to temp first
         if file_path.endswith('.ko.zst'):
             if not ZSTD_AVAILABLE:
                 return None
-            with tempfile.NamedTemporaryFile(suffix='.ko', delete=False, dir=_ensure_temp_work_dir()) as temp_file:
-                temp_path = temp_file.name
-                try:
-                    with open(file_path, 'rb') as compressed_file:
-                        dctx = zstd.ZstdDecompressor()
-                        with dctx.stream_reader(compressed_file) as reader:
-                            temp_file.write(reader.read())
-                finally:
-                    temp_file.flush()
-            try:
-                # Check both ELF modinfo and appended marker
-                if ELF_TOOLS_AVAILABLE and _elf_has_signature_info(temp_path):
-                    return True
-                if _file_has_appended_signature_marker(temp_path):
-                    return True
-                return False
-            finally:
-                try:
-                    os.unlink(temp_path)
-                except Exception:
-                    pass
+            # Check the decompressed image in memory, no temp file needed
+            return _image_has_signature(_decompress_zst(file_path))
         else:
-            if ELF_TOOLS_AVAILABLE and _elf_has_signature_info(file_path):
-                return True
-            if _file_has_appended_signature_marker(file_path):
-                return True
-            return False
+            # One mapping serves both the .modinfo lookup and the tail marker
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return _image_has_signature(mm)
     except Exception:
         return None
 
@@ -731,32 +818,20 @@ def extract_from_compressed_elf(file_path: str) -> str:
         return ""
     
     try:
-        # Decompress the file to a temporary location
-        with tempfile.NamedTemporaryFile(suffix='.ko', delete=False, dir=_ensure_temp_work_dir()) as temp_file:
-            temp_path = temp_file.name
-            
-            # Decompress using zstandard
-            with open(file_path, 'rb') as compressed_file:
-                dctx = zstd.ZstdDecompressor()
-                with dctx.stream_reader(compressed_file) as reader:
-                    temp_file.write(reader.read())
-        
-        # Extract description from decompressed file
-        description = extract_from_elf_file(temp_path)
-        
-        # Clean up temporary file
-        os.unlink(temp_path)
-        
-        return description
+        return _extract_description_from_image(_decompress_zst(file_path))
     except Exception as e:
         print(f"Warning: Error decompressing {file_path}: {e}", file=sys.stderr)
         return ""
 
 
-def parse_proc_modules() -> List[KernelModule]:
+def parse_proc_modules(resolve_paths: bool = True) -> List[KernelModule]:
     """
     Parse /proc/modules file and return a list of KernelModule objects.
     
+    Args:
+        resolve_paths: Look up each module's file path in modules.dep; callers
+            that only count or filter modules can skip building that index
+    
     Returns:
         List[KernelModule]: List of loaded kernel modules
         
@@ -767,42 +842,38 @@ def parse_proc_modules() -> List[KernelModule]:
     modules = []
     
     try:
-        with open('/proc/modules', 'r') as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Parse the line format:
-                # module_name size ref_count dependencies status address
-                parts = line.split()
-                if len(parts) < 6:
-                    continue
-                
-                name = parts[0]
-                size = int(parts[1])
-                ref_count = int(parts[2])
-                
-                # Dependencies are comma-separated, empty if none
-                deps_str = parts[3]
-                if deps_str == '-':
-                    dependencies = []
-                else:
-                    # Split by comma and filter out status markers like [permanent]
-                    deps = deps_str.split(',')
-                    dependencies = [dep.strip() for dep in deps if dep.strip() and not dep.strip().startswith('[')]
-                
-                status = parts[4]
-                address = parts[5]
-                
-                # Get file path and description using modinfo/ELF
-                file_path = get_module_file_path(name)
-                description = get_module_description(name)
-                signed_flag = is_module_signed_from_file(file_path)
-                signed_str = 'Yes' if signed_flag else ('No' if signed_flag is False else 'Unknown')
-                module = KernelModule(name, size, ref_count, dependencies, status, address, "loadable", file_path, description, signed_str)
-                modules.append(module)
-                
+        # One read() for the whole file; fields are parsed as bytes and only
+        # the ones kept as strings get decoded
+        with open('/proc/modules', 'rb') as f:
+            data = f.read()
+        
+        for line in data.split(b'\n'):
+            # Parse the line format:
+            # module_name size ref_count dependencies status address [taints]
+            parts = line.split()
+            if len(parts) < 6:
+                continue
+            
+            name = parts[0].decode()
+            size = int(parts[1])
+            ref_count = int(parts[2])
+            
+            # Dependencies are comma-separated, empty if none
+            deps_str = parts[3]
+            if deps_str == b'-':
+                dependencies = []
+            else:
+                # Split by comma and filter out status markers like [permanent]
+                dependencies = [dep.decode() for dep in deps_str.split(b',')
+                                if dep and not dep.startswith(b'[')]
+            
+            status = parts[4].decode()
+            address = parts[5].decode()
+            
+            file_path = get_module_file_path(name) if resolve_paths else ""
+            module = KernelModule(name, size, ref_count, dependencies, status, address, "loadable", file_path)
+            modules.append(module)
+        
     except FileNotFoundError:
         print("Error: /proc/modules not found. Are you running on a Linux system?", file=sys.stderr)
         sys.exit(1)
@@ -816,13 +887,66 @@ def parse_proc_modules() -> List[KernelModule]:
     return modules
 
 
+def load_module_metadata(modules: List[KernelModule]) -> None:
+    """
+    Read description and signature state for many modules at once.
+    
+    KernelModule reads these lazily, one module at a time; callers that are
+    going to show them for every module should preload them here instead.
+    
+    Args:
+        modules: Modules to load metadata for (updated in place)
+    """
+    if not modules:
+        return
+    
+    # Description and signature come from independent per-file reads, so fan them out
+    with ThreadPoolExecutor(max_workers=_MAX_IO_WORKERS) as executor:
+        metadata = executor.map(_read_module_file_metadata, [m.file_path for m in modules])
+        for module, (description, signed) in zip(modules, metadata):
+            module.description = description
+            module.signed = signed
+    
+    # Modules whose file could not be read (missing from modules.dep, xz/gz
+    # compressed, ...) fall back to modinfo, queried once for all of them
+    missing = [module for module in modules if not module.description]
+    if missing:
+        descriptions = _batch_modinfo_field([module.name for module in missing], 'description')
+        for module in missing:
+            module.description = descriptions.get(module.name, "")
+
+
+def _read_module_file_metadata(file_path: str) -> Tuple[str, str]:
+    """
+    Read the description and signature state of a module file.
+    
+    Args:
+        file_path: Path to the module file (may be empty)
+        
+    Returns:
+        Tuple[str, str]: Description and signed state ('Yes', 'No' or 'Unknown')
+    """
+    description = extract_description_from_elf(file_path) if file_path else ""
+    return description, _signed_state(file_path)
+
+
+def _signed_state(file_path: str) -> str:
+    """Return 'Yes', 'No' or 'Unknown' for the signature state of a module file."""
+    signed_flag = is_module_signed_from_file(file_path)
+    return 'Yes' if signed_flag else ('No' if signed_flag is False else 'Unknown')
+
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+@functools.lru_cache(maxsize=4096)
 def format_size(size_bytes: int) -> str:
-    """Convert bytes to human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    """Convert bytes to human readable format; sizes repeat a lot, so results are cached."""
+    if size_bytes < 1:
+        return "0.0 B"
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    unit_idx = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (unit_idx * 10)):.1f} {_SIZE_UNITS[unit_idx]}"
 
 
 def filter_modules(modules: List[Union[KernelModule, BuiltinModule]], 
@@ -885,17 +1009,26 @@ def sort_modules(modules: List[Union[KernelModule, BuiltinModule]],
     Returns:
         Sorted list of modules
     """
-    def sort_key(module):
-        if sort_by == 'name':
-            return module.name.lower()
-        elif sort_by == 'size' and isinstance(module, KernelModule):
-            return module.size
-        elif sort_by == 'refs' and isinstance(module, KernelModule):
-            return module.ref_count
-        elif sort_by == 'status' and isinstance(module, KernelModule):
-            return module.status
-        else:
+    def name_key(module):
+        return module.name.lower()
+    
+    def field_key(attr: str):
+        # Builtin modules have no size/refs/status and fall back to the name
+        def key(module):
+            if isinstance(module, KernelModule):
+                return getattr(module, attr)
             return module.name.lower()
+        return key
+    
+    # Pick the key function once instead of re-dispatching on sort_by per module
+    field = {'size': 'size', 'refs': 'ref_count', 'status': 'status'}.get(sort_by)
+    if not field:
+        sort_key = name_key
+    elif all(isinstance(module, KernelModule) for module in modules):
+        # No builtin fallback needed, so the attribute is read at C level
+        sort_key = operator.attrgetter(field)
+    else:
+        sort_key = field_key(field)
     
     return sorted(modules, key=sort_key, reverse=reverse)
 
@@ -942,37 +1075,49 @@ def modules_to_json(modules: List[Union[KernelModule, BuiltinModule]],
                 'type': module.module_type
             })
     
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode('utf-8')
     return json.dumps(data, indent=2)
 
 
+_CSV_HEADER = ('Name', 'Type', 'Size', 'Ref Count', 'Status', 'Dependencies', 'File Path', 'Description')
+
+
 def modules_to_csv(modules: List[Union[KernelModule, BuiltinModule]], 
                   builtin_modules: List[BuiltinModule] = None) -> str:
     """Convert modules to CSV format."""
-    import io
     output = io.StringIO()
-    writer = csv.writer(output)
+    write_modules_csv(output, modules, builtin_modules)
+    return output.getvalue()
+
+
+def write_modules_csv(out, modules: List[Union[KernelModule, BuiltinModule]], 
+                      builtin_modules: List[BuiltinModule] = None):
+    """Write modules as CSV to a text stream (open files with newline='')."""
+    writer = csv.writer(out)
     
     # Write header
-    writer.writerow(['Name', 'Type', 'Size', 'Ref Count', 'Status', 'Dependencies', 'File Path', 'Description'])
+    writer.writerow(_CSV_HEADER)
     
     # Write loadable modules
-    for module in modules:
-        if isinstance(module, KernelModule):
-            writer.writerow([
-                module.name,
-                'Loadable',
-                module.size,
-                module.ref_count,
-                module.status,
-                ','.join(module.dependencies) if module.dependencies else '',
-                module.file_path or 'N/A',
-                module.description or 'N/A'
-            ])
+    writer.writerows(
+        (
+            module.name,
+            'Loadable',
+            module.size,
+            module.ref_count,
+            module.status,
+            ','.join(module.dependencies),
+            module.file_path or 'N/A',
+            module.description or 'N/A'
+        )
+        for module in modules if isinstance(module, KernelModule)
+    )
     
     # Write builtin modules
     if builtin_modules:
-        for module in builtin_modules:
-            writer.writerow([
+        writer.writerows(
+            (
                 module.name,
                 'Builtin',
                 '',
@@ -981,17 +1126,54 @@ def modules_to_csv(modules: List[Union[KernelModule, BuiltinModule]],
                 '',
                 'N/A',  # Builtin modules don't have file paths
                 module.description
-            ])
+            )
+            for module in builtin_modules
+        )
+
+
+def _walk_modules(root: str):
+    """
+    Yield (path, size) for every .ko/.ko.zst file below root.
     
-    return output.getvalue()
+    A single os.scandir() traversal; symlinked directories (such as the
+    build/ and source/ links) are not followed.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith(('.ko', '.ko.zst')):
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            size = 0
+                        yield entry.path, size
+        except OSError:
+            continue
+
+
+def _iter_dep_modules(paths):
+    """Yield (path, size) for the .ko/.ko.zst files among the modules.dep paths."""
+    for path in paths:
+        if path.endswith(('.ko', '.ko.zst')):
+            try:
+                size = os.stat(path).st_size
+            except OSError:
+                size = 0
+            yield path, size
 
 
-def get_unloaded_modules(loaded_modules: List[KernelModule]) -> List[Dict]:
+def get_unloaded_modules(loaded_modules: List[KernelModule],
+                         builtin_modules: Optional[List[BuiltinModule]] = None) -> List[Dict]:
     """
     Get list of unloaded kernel modules from the current kernel version.
     
     Args:
         loaded_modules: List of currently loaded modules
+        builtin_modules: Builtin modules, excluded from the result as well
         
     Returns:
         List of dictionaries containing unloaded module information
@@ -1006,46 +1188,47 @@ def get_unloaded_modules(loaded_modules: List[KernelModule]) -> List[Dict]:
         if not os.path.exists(modules_dir):
             return unloaded_modules
         
-        # Get list of loaded module names
-        loaded_names = {module.name for module in loaded_modules}
+        # Names of loaded and builtin modules (/proc/modules uses underscores)
+        loaded_names = {module.name.replace('-', '_') for module in loaded_modules}
+        builtin_names = {module.name.replace('-', '_') for module in builtin_modules or ()}
         
-        # Find all .ko and .ko.zst files
-        ko_patterns = [
-            f'{modules_dir}/**/*.ko',
-            f'{modules_dir}/**/*.ko.zst'
-        ]
+        # modules.dep already lists every installed module; only walk the
+        # tree when it is missing (e.g. depmod was never run)
+        dep_index = _load_modules_dep_index()
+        if dep_index:
+            module_files = _iter_dep_modules(dep_index.values())
+        else:
+            module_files = _walk_modules(modules_dir)
         
-        for pattern in ko_patterns:
-            for file_path in glob.glob(pattern, recursive=True):
-                # Extract module name from file path
-                module_name = os.path.basename(file_path)
-                if module_name.endswith('.ko.zst'):
-                    module_name = module_name[:-7]  # Remove .ko.zst
-                elif module_name.endswith('.ko'):
-                    module_name = module_name[:-3]  # Remove .ko
-                
-                # Skip if module is already loaded
-                if module_name in loaded_names:
-                    continue
-                
-                # Get file size
-                try:
-                    file_size = os.path.getsize(file_path)
-                except OSError:
-                    file_size = 0
-                
-                # Get description using ELF parsing
-                description = get_module_description_from_file(file_path)
-                
-                unloaded_modules.append({
-                    'name': module_name,
-                    'file_path': file_path,
-                    'size': file_size,
-                    'description': description
-                })
+        # Index module files by normalized name, then drop loaded and builtin
+        # modules with one set difference before any file is parsed
+        files_by_name = {}
+        for file_path, file_size in module_files:
+            normalized = os.path.basename(file_path).rsplit('.ko', 1)[0].replace('-', '_')
+            files_by_name.setdefault(normalized, (file_path, file_size))
+        
+        for normalized in files_by_name.keys() - loaded_names - builtin_names:
+            file_path, file_size = files_by_name[normalized]
+            # Extract module name from file path (strip .ko or .ko.zst)
+            module_name = os.path.basename(file_path).rsplit('.ko', 1)[0]
+            
+            unloaded_modules.append({
+                'name': module_name,
+                'file_path': file_path,
+                'size': file_size,
+                'description': ""
+            })
+        
+        # Get descriptions using ELF parsing; the files are independent, so
+        # they are read concurrently
+        with ThreadPoolExecutor(max_workers=_MAX_IO_WORKERS) as executor:
+            descriptions = executor.map(get_module_description_from_file,
+                                        [module['file_path'] for module in unloaded_modules])
+            for module, description in zip(unloaded_modules, descriptions):
+                module['description'] = description
         
         # Sort by module name
-        unloaded_modules.sort(key=lambda x: x['name'])
+        unloaded_modules.sort(key=operator.itemgetter('name'))
         
     except Exception as e:
         print(f"Warning: Error getting unloaded modules: {e}", file=sys.stderr)
@@ -1070,464 +1253,440 @@ def get_module_description_from_file(file_path: str) -> str:
         return ""
 
 
-def modules_to_html(modules: List[Union[KernelModule, BuiltinModule]], 
-                   builtin_modules: List[BuiltinModule] = None,
-                   system_info: Dict = None) -> str:
-    """Convert modules to HTML format with styled report."""
-    import datetime
-    import platform
-    
-    # Get system information
-    if system_info is None:
-        system_info = {
-            'hostname': platform.node(),
-            'system': platform.system(),
-            'release': platform.release(),
-            'machine': platform.machine(),
-            'processor': platform.processor(),
-            'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
-    
-    # Calculate statistics
-    loadable_count = len(modules)
-    builtin_count = len(builtin_modules) if builtin_modules else 0
-    
-    # Get unloaded modules
-    unloaded_modules = get_unloaded_modules([m for m in modules if isinstance(m, KernelModule)])
-    unloaded_count = len(unloaded_modules)
-    
-    total_count = loadable_count + builtin_count
-    
-    # Calculate total size
-    total_size = sum(module.size for module in modules if isinstance(module, KernelModule))
-    
-    # Group modules by status
-    status_groups = {}
-    for module in modules:
-        if isinstance(module, KernelModule):
-            status = module.status
-            if status not in status_groups:
-                status_groups[status] = 0
-            status_groups[status] += 1
-    
-    # Generate HTML
-    html = f"""<!DOCTYPE html>
+def _minify_static_markup(markup: str) -> str:
+    """Drop indentation, blank lines and whole-line // comments from static markup."""
+    lines = (line.strip() for line in markup.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith('//')) + "\n"
+
+
+# HTML report template pieces. Only _HTML_DOC_START and _HTML_BODY_START are
+# formatted per report; the styles and scripts in _HTML_HEAD are static, so
+# they need no brace escaping. The overview chart reads its counts from the
+# canvas' data-counts attribute.
+_HTML_DOC_START = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Kernel Modules Report - {system_info['hostname']}</title>
-    <style>
-        body {{
+    <title>Kernel Modules Report - {hostname}</title>
+"""
+
+_HTML_HEAD = """    <style>
+        body {
             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
             margin: 0;
             padding: 20px;
             background-color: #f8fafc;
             color: #1e293b;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             background: white;
             border-radius: 8px;
             box-shadow: 0 2px 10px rgba(0,0,0,0.1);
             overflow: hidden;
-        }}
-        .header {{
+        }
+        .header {
             background: linear-gradient(135deg, #1e40af 0%, #3730a3 100%);
             color: white;
             padding: 30px;
             text-align: center;
-        }}
-        .header h1 {{
+        }
+        .header h1 {
             margin: 0;
             font-size: 2.5em;
             font-weight: 300;
-        }}
-        .header p {{
+        }
+        .header p {
             margin: 10px 0 0 0;
             opacity: 0.9;
             font-size: 1.1em;
-        }}
-        .stats {{
+        }
+        .stats {
             display: grid;
             grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
             gap: 20px;
             padding: 30px;
             background: #f1f5f9;
-        }}
-        .stat-card {{
+        }
+        .stat-card {
             background: white;
             padding: 20px;
             border-radius: 8px;
             text-align: center;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .stat-number {{
+        }
+        .stat-number {
             font-size: 2em;
             font-weight: bold;
             color: #1e40af;
             margin-bottom: 5px;
-        }}
-        .stat-label {{
+        }
+        .stat-label {
             color: #64748b;
             font-size: 0.9em;
             text-transform: uppercase;
             letter-spacing: 1px;
-        }}
-        .content {{
+        }
+        .content {
             padding: 30px;
-        }}
-        .section {{
+        }
+        .section {
             margin-bottom: 40px;
-        }}
-        .section h2 {{
+        }
+        .section h2 {
             color: #1e293b;
             border-bottom: 2px solid #1e40af;
             padding-bottom: 10px;
             margin-bottom: 20px;
-        }}
-        .module-table {{
+        }
+        .module-table {
             width: 100%;
             border-collapse: collapse;
             margin-top: 20px;
             border: 1px solid #cbd5e1;
-        }}
-        .module-table th {{
+        }
+        .module-table th {
             background: #1e40af;
             color: white;
             padding: 12px;
             text-align: left;
             font-weight: 500;
             border-right: 1px solid #3b82f6;
-        }}
-        .module-table th:last-child {{
+        }
+        .module-table th:last-child {
             border-right: none;
-        }}
-        .module-table th.sortable {{
+        }
+        .module-table th.sortable {
             cursor: pointer;
             user-select: none;
             position: relative;
-        }}
-        .module-table th.sortable:hover {{
+        }
+        .module-table th.sortable:hover {
             background: #3b82f6;
-        }}
-        .module-table th.sortable::after {{
+        }
+        .module-table th.sortable::after {
             content: ' ↕';
             opacity: 0.5;
             font-size: 0.8em;
-        }}
-        .module-table th.sortable.asc::after {{
+        }
+        .module-table th.sortable.asc::after {
             content: ' ↑';
             opacity: 1;
-        }}
-        .module-table th.sortable.desc::after {{
+        }
+        .module-table th.sortable.desc::after {
             content: ' ↓';
             opacity: 1;
-        }}
-        .collapsible-header {{
+        }
+        .collapsible-header {
             cursor: pointer;
             user-select: none;
             position: relative;
-        }}
-        .collapsible-header::after {{
+        }
+        .collapsible-header::after {
             content: ' ▼';
             position: absolute;
             right: 15px;
             top: 50%;
             transform: translateY(-50%);
             transition: transform 0.3s ease;
-        }}
-        .collapsible-header.collapsed::after {{
+        }
+        .collapsible-header.collapsed::after {
             transform: translateY(-50%) rotate(-90deg);
-        }}
-        .collapsible-content {{
+        }
+        .collapsible-content {
             transition: opacity 0.3s ease;
-        }}
-        .collapsible-content.collapsed {{
+        }
+        .collapsible-content.collapsed {
             display: none;
-        }}
-        .collapsible-content.expanded {{
+        }
+        .collapsible-content.expanded {
             display: block;
-        }}
-        .module-table td {{
+        }
+        .module-table td {
             padding: 12px;
             border-bottom: 1px solid #e2e8f0;
             border-right: 1px solid #e2e8f0;
-        }}
-        .module-table td.description {{
+        }
+        .module-table td.description {
             white-space: normal;
             word-break: break-word;
             overflow-wrap: anywhere;
-        }}
-        .module-table td:last-child {{
+        }
+        .module-table td:last-child {
             border-right: none;
-        }}
-        .module-table tr:nth-child(even) {{
+        }
+        .module-table tr:nth-child(even) {
             background: #f8fafc;
-        }}
-        .module-table tr:hover {{
+        }
+        .module-table tr:hover {
             background: #e0f2fe;
-        }}
-        .module-type {{
+        }
+        .module-type {
             display: inline-block;
             padding: 4px 8px;
             border-radius: 4px;
             font-size: 0.8em;
             font-weight: bold;
             text-transform: uppercase;
-        }}
-        .type-loadable {{
+        }
+        .type-loadable {
             background: #dcfce7;
             color: #166534;
-        }}
-        .type-builtin {{
+        }
+        .type-builtin {
             background: #fef3c7;
             color: #92400e;
-        }}
-        .status-live {{
+        }
+        .status-live {
             color: #059669;
             font-weight: bold;
-        }}
-        .status-dead {{
+        }
+        .status-dead {
             color: #dc2626;
             font-weight: bold;
-        }}
-        .status-unloading {{
+        }
+        .status-unloading {
             color: #d97706;
             font-weight: bold;
-        }}
-        .dependencies {{
+        }
+        .dependencies {
             max-width: 200px;
             overflow: hidden;
             text-overflow: ellipsis;
             white-space: nowrap;
-        }}
-        .footer {{
+        }
+        .footer {
             background: #1e293b;
             color: white;
             padding: 20px;
             text-align: center;
             font-size: 0.9em;
-        }}
-        .search-box {{
+        }
+        .search-box {
             margin-bottom: 20px;
-        }}
-        .search-box input {{
+        }
+        .search-box input {
             width: 100%;
             padding: 10px;
             border: 1px solid #cbd5e1;
             border-radius: 4px;
             font-size: 16px;
             background: white;
-        }}
-        .column-selector {{
+        }
+        .column-selector {
             margin-bottom: 12px;
             padding: 10px 14px;
             background: #f1f5f9;
             border-radius: 6px;
             border: 1px solid #e2e8f0;
-        }}
-        .column-selector .column-selector-label {{
+        }
+        .column-selector .column-selector-label {
             font-weight: 600;
             color: #475569;
             margin-right: 12px;
-        }}
-        .column-selector label {{
+        }
+        .column-selector label {
             margin-right: 14px;
             cursor: pointer;
             font-size: 0.95em;
             white-space: nowrap;
-        }}
-        .column-selector label:hover {{
+        }
+        .column-selector label:hover {
             color: #1e40af;
-        }}
-        .column-selector input[type="checkbox"] {{
+        }
+        .column-selector input[type="checkbox"] {
             margin-right: 4px;
             vertical-align: middle;
-        }}
-        .summary {{
+        }
+        .summary {
             background: #e0f2fe;
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 20px;
-        }}
-        .summary h3 {{
+        }
+        .summary h3 {
             margin-top: 0;
             color: #0c4a6e;
-        }}
-        .summary ul {{
+        }
+        .summary ul {
             margin: 10px 0;
             padding-left: 20px;
-        }}
-        .summary li {{
+        }
+        .summary li {
             margin: 5px 0;
-        }}
+        }
     </style>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
     <script>
-        function searchModules() {{
+        function searchModules() {
             const input = document.getElementById('searchInput');
             const filter = input.value.toLowerCase();
             const tables = document.querySelectorAll('.module-table');
             
-            tables.forEach(table => {{
+            tables.forEach(table => {
                 const rows = table.getElementsByTagName('tr');
-                for (let i = 1; i < rows.length; i++) {{
+                for (let i = 1; i < rows.length; i++) {
                     const name = rows[i].getElementsByTagName('td')[0];
-                    if (name) {{
+                    if (name) {
                         const txtValue = name.textContent || name.innerText;
-                        if (txtValue.toLowerCase().indexOf(filter) > -1) {{
+                        if (txtValue.toLowerCase().indexOf(filter) > -1) {
                             rows[i].style.display = '';
-                        }} else {{
+                        } else {
                             rows[i].style.display = 'none';
-                        }}
-                    }}
-                }}
-            }});
-        }}
+                        }
+                    }
+                }
+            });
+        }
         
-        function sortTable(table, column, isNumeric = false) {{
+        function sortTable(table, column, isNumeric = false) {
             const tbody = table.querySelector('tbody');
             const rows = Array.from(tbody.querySelectorAll('tr'));
             const header = table.querySelectorAll('th')[column];
             
             // Remove existing sort classes
-            table.querySelectorAll('th').forEach(th => {{
+            table.querySelectorAll('th').forEach(th => {
                 th.classList.remove('asc', 'desc');
-            }});
+            });
             
             // Determine sort direction
             const isAsc = !header.classList.contains('asc');
             header.classList.add(isAsc ? 'asc' : 'desc');
             
             // Sort rows
-            rows.sort((a, b) => {{
+            rows.sort((a, b) => {
                 const aVal = a.cells[column].textContent.trim();
                 const bVal = b.cells[column].textContent.trim();
                 
                 let comparison = 0;
-                if (isNumeric) {{
+                if (isNumeric) {
                     const aNum = parseFloat(aVal.replace(/[^0-9.-]/g, '')) || 0;
                     const bNum = parseFloat(bVal.replace(/[^0-9.-]/g, '')) || 0;
                     comparison = aNum - bNum;
-                }} else {{
+                } else {
                     comparison = aVal.localeCompare(bVal);
-                }}
+                }
                 
                 return isAsc ? comparison : -comparison;
-            }});
+            });
             
             // Re-append sorted rows
             rows.forEach(row => tbody.appendChild(row));
-        }}
+        }
         
-        function makeSortable() {{
+        function makeSortable() {
             const tables = document.querySelectorAll('.module-table');
-            tables.forEach(table => {{
+            tables.forEach(table => {
                 const headers = table.querySelectorAll('th');
-                headers.forEach((header, index) => {{
-                    if (header.textContent.trim() !== '') {{
+                headers.forEach((header, index) => {
+                    if (header.textContent.trim() !== '') {
                         header.classList.add('sortable');
-                        header.addEventListener('click', () => {{
+                        header.addEventListener('click', () => {
                             // Determine if column is numeric based on header text
                             const numericColumns = ['Size', 'Ref Count', 'Count', 'Percentage'];
                             const isNumeric = numericColumns.includes(header.textContent.trim());
                             sortTable(table, index, isNumeric);
-                        }});
-                    }}
-                }});
-            }});
-        }}
+                        });
+                    }
+                });
+            });
+        }
         
-        function makeCollapsible() {{
+        function makeCollapsible() {
             const sections = document.querySelectorAll('.section');
-            sections.forEach((section, index) => {{
+            sections.forEach((section, index) => {
                 const header = section.querySelector('h2');
                 const table = section.querySelector('.module-table');
                 
-                if (header && table) {{
+                if (header && table) {
                     // First table (Loadable Modules) is expanded by default
-                    if (index === 0) {{
+                    if (index === 0) {
                         header.classList.add('collapsible-header', 'expanded');
                         table.classList.add('collapsible-content', 'expanded');
-                    }} else {{
+                    } else {
                         header.classList.add('collapsible-header', 'collapsed');
                         table.classList.add('collapsible-content', 'collapsed');
-                    }}
+                    }
                     
-                    header.addEventListener('click', () => {{
+                    header.addEventListener('click', () => {
                         const isCollapsed = header.classList.contains('collapsed');
-                        if (isCollapsed) {{
+                        if (isCollapsed) {
                             header.classList.remove('collapsed');
                             header.classList.add('expanded');
                             table.classList.remove('collapsed');
                             table.classList.add('expanded');
-                        }} else {{
+                        } else {
                             header.classList.add('collapsed');
                             header.classList.remove('expanded');
                             table.classList.remove('expanded');
                             table.classList.add('collapsed');
-                        }}
-                    }});
-                }}
-            }});
-        }}
+                        }
+                    });
+                }
+            });
+        }
         
-        function setupColumnToggles() {{
-            document.querySelectorAll('.column-selector').forEach(selectorEl => {{
+        function setupColumnToggles() {
+            document.querySelectorAll('.column-selector').forEach(selectorEl => {
                 const tableId = selectorEl.getAttribute('data-for-table');
                 const table = tableId ? document.getElementById(tableId) : null;
                 if (!table) return;
-                selectorEl.querySelectorAll('input[type="checkbox"][data-col]').forEach(cb => {{
+                selectorEl.querySelectorAll('input[type="checkbox"][data-col]').forEach(cb => {
                     const col = parseInt(cb.getAttribute('data-col'), 10);
-                    const toggleColumn = (show) => {{
-                        table.querySelectorAll('tr').forEach(tr => {{
+                    const toggleColumn = (show) => {
+                        table.querySelectorAll('tr').forEach(tr => {
                             const cell = tr.cells[col];
                             if (cell) cell.style.display = show ? '' : 'none';
-                        }});
-                    }};
+                        });
+                    };
                     cb.addEventListener('change', () => toggleColumn(cb.checked));
                     toggleColumn(cb.checked);
-                }});
-            }});
-        }}
+                });
+            });
+        }
         
         // Initialize sorting, collapsible and chart when page loads
-        document.addEventListener('DOMContentLoaded', () => {{
+        document.addEventListener('DOMContentLoaded', () => {
             makeSortable();
             makeCollapsible();
             setupColumnToggles();
-            try {{
+            try {
                 const ov = document.getElementById('overviewChart');
-                if (ov) {{
-                    new Chart(ov, {{
+                if (ov) {
+                    new Chart(ov, {
                         type: 'pie',
-                        data: {{
+                        data: {
                             labels: ['Loaded', 'Builtin', 'Unloaded'],
-                            datasets: [{{
-                                data: [{loadable_count}, {builtin_count}, {unloaded_count}],
+                            datasets: [{
+                                data: JSON.parse(ov.dataset.counts),
                                 backgroundColor: ['#1e40af','#f59e0b','#94a3b8']
-                            }}]
-                        }},
-                        options: {{
+                            }]
+                        },
+                        options: {
                             maintainAspectRatio: false,
-                            plugins: {{ legend: {{ display: true, position: 'bottom' }} }},
-                            layout: {{ padding: 8 }}
-                        }}
-                    }});
-                }}
-            }} catch (e) {{
+                            plugins: { legend: { display: true, position: 'bottom' } },
+                            layout: { padding: 8 }
+                        }
+                    });
+                }
+            } catch (e) {
                 // no-op
-            }}
-        }});
+            }
+        });
     </script>
 </head>
-<body>
+"""
+# Newlines are kept so the inline script never depends on semicolon insertion
+_HTML_HEAD = _minify_static_markup(_HTML_HEAD)
+_HTML_HEAD_BYTES = _HTML_HEAD.encode('utf-8')
+
+_HTML_BODY_START = """<body>
     <div class="container">
         <div class="header">
             <h1>Kernel Modules Report</h1>
-            <p>{system_info['hostname']} - {system_info['timestamp']}</p>
+            <p>{hostname} - {timestamp}</p>
         </div>
         
         <div class="stats">
@@ -1548,7 +1707,7 @@ def modules_to_html(modules: List[Union[KernelModule, BuiltinModule]],
                 <div class="stat-label">Unloaded</div>
             </div>
             <div class="stat-card">
-                <div class="stat-number">{format_size(total_size)}</div>
+                <div class="stat-number">{total_size}</div>
                 <div class="stat-label">Total Size</div>
             </div>
         </div>
@@ -1557,11 +1716,11 @@ def modules_to_html(modules: List[Union[KernelModule, BuiltinModule]],
             <div class="summary">
                 <h3>System Information</h3>
                 <ul>
-                    <li><strong>Hostname:</strong> {system_info['hostname']}</li>
-                    <li><strong>System:</strong> {system_info['system']} {system_info['release']}</li>
-                    <li><strong>Architecture:</strong> {system_info['machine']}</li>
-                    <li><strong>Processor:</strong> {system_info['processor']}</li>
-                    <li><strong>Report Generated:</strong> {system_info['timestamp']}</li>
+                    <li><strong>Hostname:</strong> {hostname}</li>
+                    <li><strong>System:</strong> {system} {release}</li>
+                    <li><strong>Architecture:</strong> {machine}</li>
+                    <li><strong>Processor:</strong> {processor}</li>
+                    <li><strong>Report Generated:</strong> {timestamp}</li>
                 </ul>
             </div>
             <div class="section">
@@ -1570,7 +1729,7 @@ def modules_to_html(modules: List[Union[KernelModule, BuiltinModule]],
                     <div style="flex:0 0 auto; width:960px; height:480px;">
                         <h3 style="margin:0 0 8px 0; color:#0c4a6e;">Modules Overview</h3>
                         <div style="position:relative; width:100%; height:400px;">
-                            <canvas id="overviewChart"></canvas>
+                            <canvas id="overviewChart" data-counts="[{loadable_count}, {builtin_count}, {unloaded_count}]"></canvas>
                         </div>
                     </div>
                 </div>
@@ -1607,33 +1766,143 @@ def modules_to_html(modules: List[Union[KernelModule, BuiltinModule]],
                         </tr>
                     </thead>
                     <tbody>"""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_static_system_info() -> Mapping[str, str]:
+    """
+    Host details shown in the HTML report; none of them change while the
+    process runs, and platform.processor() may fork 'uname -p', so they are
+    looked up once.
+    """
+    return MappingProxyType({
+        'hostname': platform.node(),
+        'system': platform.system(),
+        'release': platform.release(),
+        'machine': platform.machine(),
+        'processor': platform.processor()
+    })
+
+
+# Table row templates for the HTML report; every text value is escaped
+_LOADABLE_ROW = """
+                        <tr>
+                            <td><strong>%s</strong></td>
+                            <td>%s</td>
+                            <td>%s</td>
+                            <td class="dependencies" title="%s">%s</td>
+                            <td><code>%s</code></td>
+                            <td class="description">%s</td>
+                            <td>%s</td>
+                            <td><code>%s</code></td>
+                        </tr>"""
+
+_BUILTIN_ROW = """
+                            <tr>
+                                <td><strong>%s</strong></td>
+                                <td class="description">%s</td>
+                            </tr>"""
+
+_UNLOADED_ROW = """
+                        <tr>
+                            <td><strong>%s</strong></td>
+                            <td>%s</td>
+                            <td><code>%s</code></td>
+                            <td class="description">%s</td>
+                        </tr>"""
+
+
+def modules_to_html(modules: List[Union[KernelModule, BuiltinModule]], 
+                   builtin_modules: List[BuiltinModule] = None,
+                   system_info: Dict = None) -> str:
+    """Convert modules to HTML format with styled report."""
+    return "".join(iter_modules_html(modules, builtin_modules, system_info))
+
+
+def iter_modules_html_bytes(modules: List[Union[KernelModule, BuiltinModule]], 
+                            builtin_modules: List[BuiltinModule] = None,
+                            system_info: Dict = None) -> Iterator[bytes]:
+    """UTF-8 encoded chunks of iter_modules_html(), for writing to binary files."""
+    for chunk in iter_modules_html(modules, builtin_modules, system_info):
+        # The static head is by far the largest chunk and is encoded only once
+        yield _HTML_HEAD_BYTES if chunk is _HTML_HEAD else chunk.encode('utf-8')
+
+
+def _loadable_row_cells(module: KernelModule) -> Tuple:
+    """Escaped cell values of a _LOADABLE_ROW, in template order."""
+    escape = html.escape
+    deps_str = escape(', '.join(module.dependencies) if module.dependencies else 'None')
+    return (escape(module.name), format_size(module.size), module.ref_count, deps_str, deps_str,
+            escape(module.file_path or 'N/A'), escape(module.description or 'N/A'),
+            escape(module.signed), escape(module.address))
+
+
+def iter_modules_html(modules: List[Union[KernelModule, BuiltinModule]], 
+                      builtin_modules: List[BuiltinModule] = None,
+                      system_info: Dict = None) -> Iterator[str]:
+    """
+    Generate the HTML report chunk by chunk.
     
-    # Add loadable modules
+    Lets callers stream a large report into a file without holding the
+    whole document in memory; see modules_to_html() for the joined string.
+    """
+    # Get system information
+    if system_info is None:
+        system_info = {
+            **_get_static_system_info(),
+            'timestamp': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+    
+    # Host details end up in the markup, so escape them like module fields
+    escape = html.escape
+    system_info = {key: escape(str(value)) for key, value in system_info.items()}
+    
+    # Calculate statistics
+    loadable_count = len(modules)
+    builtin_count = len(builtin_modules) if builtin_modules else 0
+    
+    # Collect loadable modules and their total size in one pass
+    loadable_list = []
+    total_size = 0
     for module in modules:
         if isinstance(module, KernelModule):
-            deps_str = ', '.join(module.dependencies) if module.dependencies else 'None'
-            file_path = module.file_path or 'N/A'
-            description = module.description or 'N/A'
-            html += f"""
-                        <tr>
-                            <td><strong>{module.name}</strong></td>
-                            <td>{format_size(module.size)}</td>
-                            <td>{module.ref_count}</td>
-                            <td class="dependencies" title="{deps_str}">{deps_str}</td>
-                            <td><code>{file_path}</code></td>
-                            <td class="description">{description}</td>
-                            <td>{module.signed}</td>
-                            <td><code>{module.address}</code></td>
-                        </tr>"""
+            loadable_list.append(module)
+            total_size += module.size
+    
+    # Get unloaded modules
+    unloaded_modules = get_unloaded_modules(loadable_list, builtin_modules)
+    unloaded_count = len(unloaded_modules)
     
-    html += """
+    total_count = loadable_count + builtin_count
+    
+    # Generate HTML
+    yield _HTML_DOC_START.format(hostname=system_info['hostname'])
+    yield _HTML_HEAD
+    yield _HTML_BODY_START.format(
+        hostname=system_info['hostname'],
+        timestamp=system_info['timestamp'],
+        system=system_info['system'],
+        release=system_info['release'],
+        machine=system_info['machine'],
+        processor=system_info['processor'],
+        total_count=total_count,
+        loadable_count=loadable_count,
+        builtin_count=builtin_count,
+        unloaded_count=unloaded_count,
+        total_size=format_size(total_size)
+    )
+    
+    # Add loadable modules
+    yield from (_LOADABLE_ROW % _loadable_row_cells(module) for module in loadable_list)
+    
+    yield """
                     </tbody>
                 </table>
             </div>"""
     
     # Add builtin modules if present
     if builtin_modules:
-        html += f"""
+        yield f"""
             <div class="section">
                 <h2>Builtin Kernel Modules ({builtin_count})</h2>
                 <div class="column-selector" data-for-table="table-builtin">
@@ -1650,21 +1919,19 @@ def modules_to_html(modules: List[Union[KernelModule, BuiltinModule]],
                     </thead>
                     <tbody>"""
         
-        for module in builtin_modules:
-            html += f"""
-                            <tr>
-                                <td><strong>{module.name}</strong></td>
-                                <td class="description">{module.description or 'N/A'}</td>
-                            </tr>"""
+        yield from (
+            _BUILTIN_ROW % (escape(module.name), escape(module.description or 'N/A'))
+            for module in builtin_modules
+        )
         
-        html += """
+        yield """
                     </tbody>
                 </table>
             </div>"""
     
     # Add unloaded modules table
     if unloaded_modules:
-        html += f"""
+        yield f"""
             <div class="section">
                 <h2>Unloaded Kernel Modules ({unloaded_count})</h2>
                 <div class="column-selector" data-for-table="table-unloaded">
@@ -1685,25 +1952,24 @@ def modules_to_html(modules: List[Union[KernelModule, BuiltinModule]],
                     </thead>
                     <tbody>"""
         
-        for module in unloaded_modules:
-            file_path = module['file_path']
-            description = module['description'] or 'N/A'
-            html += f"""
-                        <tr>
-                            <td><strong>{module['name']}</strong></td>
-                            <td>{format_size(module['size'])}</td>
-                            <td><code>{file_path}</code></td>
-                            <td class="description">{description}</td>
-                        </tr>"""
+        yield from (
+            _UNLOADED_ROW % (
+                escape(module['name']),
+                format_size(module['size']),
+                escape(module['file_path']),
+                escape(module['description'] or 'N/A')
+            )
+            for module in unloaded_modules
+        )
         
-        html += """
+        yield """
                     </tbody>
                 </table>
             </div>"""
     
     # Module Status Summary removed per request
     
-    html += f"""
+    yield f"""
         </div>
         
         <div class="footer">
@@ -1713,12 +1979,16 @@ def modules_to_html(modules: List[Union[KernelModule, BuiltinModule]],
     </div>
 </body>
 </html>"""
-    
-    return html
+
+
+# Row layout of the simple display table
+_TABLE_ROW = "| %-25s | %-10s | %-10s | %-10s | %-10s | %-50s |"
+_TABLE_HEADER = _TABLE_ROW % ('Module Name', 'Type', 'Size', 'Ref Count', 'Status', 'Description')
+_TABLE_SEPARATOR = "|" + "-" * 28 + "|" + "-" * 12 + "|" + "-" * 12 + "|" + "-" * 12 + "|" + "-" * 12 + "|" + "-" * 52 + "|"
 
 
 def display_modules(modules: List[KernelModule], builtin_modules: List[BuiltinModule] = None, 
-                   show_details: bool = False, show_builtin: bool = False, quiet: bool = False):
+                   show_details: bool = False, show_builtin: bool = False, quiet: bool = False, file=None):
     """
     Display the loaded kernel modules and optionally builtin modules.
     
@@ -1728,49 +1998,58 @@ def display_modules(modules: List[KernelModule], builtin_modules: List[BuiltinMo
         show_details: If True, show detailed information for each module
         show_builtin: If True, include builtin modules in the output
         quiet: If True, suppress headers and only show module data
+        file: Stream to write to (defaults to the current sys.stdout)
     """
     total_modules = len(modules)
     if show_builtin and builtin_modules:
         total_modules += len(builtin_modules)
     
+    # Lines are collected and written out with a single call
+    lines = []
     if not quiet:
-        print(f"Kernel Modules ({total_modules} total)\n")
-        print("=" * 60)
+        lines.append(f"Kernel Modules ({total_modules} total)\n")
+        lines.append("=" * 60)
     
     if not show_details:
         # Simple table format
         if not quiet:
-            print(f"| {'Module Name':<25} | {'Type':<10} | {'Size':<10} | {'Ref Count':<10} | {'Status':<10} | {'Description':<50} |")
-            print("|" + "-" * 28 + "|" + "-" * 12 + "|" + "-" * 12 + "|" + "-" * 12 + "|" + "-" * 12 + "|" + "-" * 52 + "|")
+            lines.append(_TABLE_HEADER)
+            lines.append(_TABLE_SEPARATOR)
         
         # Display loadable modules
-        for module in modules:
-            size_str = format_size(module.size)
-            description = module.description or 'N/A'
-            print(f"| {module.name:<25} | {'Loadable':<10} | {size_str:<10} | {module.ref_count:<10} | {module.status:<10} | {description:<50} |")
+        lines.extend(_TABLE_ROW % (module.name, 'Loadable', format_size(module.size), module.ref_count,
+                                   module.status, module.description or 'N/A')
+                     for module in modules)
         
         # Display builtin modules if requested
         if show_builtin and builtin_modules:
-            for module in builtin_modules:
-                print(f"| {module.name:<25} | {'Builtin':<10} | {'N/A':<10} | {'N/A':<10} | {'Always':<10} | {module.description or 'N/A':<50} |")
+            lines.extend(_TABLE_ROW % (module.name, 'Builtin', 'N/A', 'N/A', 'Always', module.description or 'N/A')
+                         for module in builtin_modules)
     else:
         # Detailed format
         if not quiet:
-            print("Loadable Kernel Modules:")
-            print("-" * 30)
-        for i, module in enumerate(modules, 1):
-            print(f"{i}. {module}")
+            lines.append("Loadable Kernel Modules:")
+            lines.append("-" * 30)
+        lines.extend(f"{i}. {module}" for i, module in enumerate(modules, 1))
         
         if show_builtin and builtin_modules:
             if not quiet:
-                print(f"\nBuiltin Kernel Modules ({len(builtin_modules)} total):")
-                print("-" * 30)
-            for i, module in enumerate(builtin_modules, 1):
-                print(f"{i}. {module}")
+                lines.append(f"\nBuiltin Kernel Modules ({len(builtin_modules)} total):")
+                lines.append("-" * 30)
+            lines.extend(f"{i}. {module}" for i, module in enumerate(builtin_modules, 1))
+    
+    if lines:
+        lines.append("")
+        (file or sys.stdout).write("\n".join(lines))
 
 
 def main():
     """Main function to run the kernel module lister."""
+    # A bare --count needs none of the options, so skip building the parser
+    if sys.argv[1:] in (['--count'], ['-c']):
+        print(f"Total loaded kernel modules: {len(parse_proc_modules(resolve_paths=False))}")
+        return
+    
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -1858,41 +2137,36 @@ Examples:
             print(f"Arguments: {args}", file=sys.stderr)
         
         # Get loadable modules
-        loadable_modules = parse_proc_modules()
+        # File paths are only shown in listings, never needed for counts
+        loadable_modules = parse_proc_modules(resolve_paths=not args.count)
         
         # Get builtin modules if requested
         builtin_modules = None
         if args.builtin or args.builtin_only or args.html:
             builtin_modules = get_all_builtin_modules()
         
-        # Combine modules for processing
-        all_modules = []
-        if not args.builtin_only:
-            all_modules.extend(loadable_modules)
-        if args.builtin or args.builtin_only or args.html:
-            if builtin_modules:
-                all_modules.extend(builtin_modules)
+        # Loadable and builtin modules are filtered and sorted as separate lists
+        filtered_loadable = [] if args.builtin_only else loadable_modules
+        filtered_builtin = builtin_modules or []
         
         # Apply filtering
         if any([args.filter, args.min_size, args.max_size, args.min_refs, args.status]):
-            all_modules = filter_modules(
-                all_modules,
+            filter_args = dict(
                 name_pattern=args.filter,
                 min_size=args.min_size,
                 max_size=args.max_size,
                 min_refs=args.min_refs,
                 status=args.status
             )
+            filtered_loadable = filter_modules(filtered_loadable, **filter_args)
+            filtered_builtin = filter_modules(filtered_builtin, **filter_args)
         
         # Apply sorting
-        all_modules = sort_modules(all_modules, args.sort, args.reverse)
-        
-        # Separate loadable and builtin modules for display
-        filtered_loadable = [m for m in all_modules if isinstance(m, KernelModule)]
-        filtered_builtin = [m for m in all_modules if isinstance(m, BuiltinModule)]
+        filtered_loadable = sort_modules(filtered_loadable, args.sort, args.reverse)
+        filtered_builtin = sort_modules(filtered_builtin, args.sort, args.reverse)
         
         if args.count:
-            total_count = len(all_modules)
+            total_count = len(filtered_loadable) + len(filtered_builtin)
             loadable_count = len(filtered_loadable)
             builtin_count = len(filtered_builtin)
             
@@ -1903,39 +2177,64 @@ Examples:
             else:
                 print(f"Total loaded kernel modules: {loadable_count}")
         else:
-            # Handle different output formats
+            # Every output format shows descriptions, so read them in bulk
+            load_module_metadata(filtered_loadable)
+            
+            # Handle different output formats; CSV and the standard display
+            # are written straight to the destination instead of into a string
             output_content = ""
+            output_chunks = None
+            write_text = None
             if args.json:
                 output_content = modules_to_json(filtered_loadable, filtered_builtin)
             elif args.csv:
-                output_content = modules_to_csv(filtered_loadable, filtered_builtin)
+                def write_text(out):
+                    write_modules_csv(out, filtered_loadable, filtered_builtin)
             elif args.html:
-                output_content = modules_to_html(filtered_loadable, filtered_builtin)
+                # The report is streamed out chunk by chunk rather than joined;
+                # files get pre-encoded bytes so the static head is not re-encoded
+                if args.output:
+                    output_chunks = iter_modules_html_bytes(filtered_loadable, filtered_builtin)
+                else:
+                    output_chunks = iter_modules_html(filtered_loadable, filtered_builtin)
             else:
-                # Standard display - capture output
-                import io
-                from contextlib import redirect_stdout
-                f = io.StringIO()
-                with redirect_stdout(f):
+                def write_text(out):
                     if args.builtin_only:
                         if filtered_builtin:
-                            display_modules([], filtered_builtin, args.detailed, True, args.quiet)
+                            display_modules([], filtered_builtin, args.detailed, True, args.quiet, file=out)
                         else:
-                            print("No builtin modules found.")
+                            print("No builtin modules found.", file=out)
                     else:
-                        display_modules(filtered_loadable, filtered_builtin, args.detailed, args.builtin, args.quiet)
-                output_content = f.getvalue()
+                        display_modules(filtered_loadable, filtered_builtin, args.detailed, args.builtin,
+                                        args.quiet, file=out)
             
             # Write output to file or stdout
             if args.output:
                 try:
-                    with open(args.output, 'w', encoding='utf-8') as f:
-                        f.write(output_content)
+                    if output_chunks is not None:
+                        with open(args.output, 'wb') as f:
+                            f.writelines(output_chunks)
+                    elif write_text is not None:
+                        with open(args.output, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+                            write_text(f)
+                    elif output_content.isascii():
+                        # Pure ASCII needs no text codec layer; write the bytes in one go
+                        with open(args.output, 'wb', buffering=1 << 20) as f:
+                            f.write(output_content.encode('ascii'))
+                    else:
+                        with open(args.output, 'w', encoding='utf-8') as f:
+                            f.write(output_content)
                     if args.verbose:
                         print(f"Output written to {args.output}", file=sys.stderr)
                 except Exception as e:
                     print(f"Error writing to file {args.output}: {e}", file=sys.stderr)
                     sys.exit(1)
+            elif output_chunks is not None:
+                sys.stdout.writelines(output_chunks)
+                print()
+            elif write_text is not None:
+                write_text(sys.stdout)
+                print()
             else:
                 print(output_content)
             
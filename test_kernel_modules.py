@@ -7,19 +7,111 @@ its output against the standard lsmod command to ensure consistency.
 """
 
 import unittest
+import shutil
 import subprocess
 import sys
-import os
-from typing import List, Dict, Set
+from typing import Any, List, Dict, FrozenSet, Mapping, Set, Tuple
 import tempfile
 import io
-from contextlib import redirect_stdout
+from contextlib import redirect_stdout, redirect_stderr
+from types import MappingProxyType
+from unittest.mock import patch
 
 # Import our module
-from list_kernel_modules import parse_proc_modules, KernelModule, format_size
+from list_kernel_modules import (parse_proc_modules, load_module_metadata, KernelModule,
+                                 format_size, display_modules, main)
 
+# Probed once so the lsmod comparisons skip without spawning anything
+_HAS_LSMOD = shutil.which('lsmod') is not None
 
-class TestKernelModuleLister(unittest.TestCase):
+# Expected format_size() output for representative sizes
+_FORMAT_SIZE_CASES = (
+    (1024, "1.0 KB"),
+    (1536, "1.5 KB"),
+    (1048576, "1.0 MB"),
+    (1073741824, "1.0 GB"),
+    (512, "512.0 B"),
+    (0, "0.0 B"),
+)
+
+
+def _parse_lsmod_deps(deps_field: str) -> FrozenSet[str]:
+    """Split lsmod's "Used by" module list, dropping empty entries and status markers."""
+    return frozenset(dep for dep in (d.strip() for d in deps_field.split(',')) if dep and not dep.startswith('['))
+
+
+def _run_main(*args: str) -> Tuple[int, str]:
+    """Run the script's main() in-process and return its exit code and stdout."""
+    stdout = io.StringIO()
+    with patch.object(sys, 'argv', ['list_kernel_modules.py', *args]), \
+            redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+        try:
+            main()
+            returncode = 0
+        except SystemExit as e:
+            returncode = e.code or 0
+    return returncode, stdout.getvalue()
+
+
+class _CachedModuleData:
+    """
+    Mixin that parses /proc/modules and runs lsmod once per test class.
+    
+    Tests only read the cached data, so they stay independent of each other
+    and can be spread over workers (e.g. pytest -n auto with pytest-xdist).
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """Parse /proc/modules, load its metadata and run lsmod once for all tests in the class."""
+        super().setUpClass()
+        try:
+            cls._modules = parse_proc_modules()
+        except SystemExit:
+            # parse_proc_modules() exits when /proc/modules is unreadable; leave
+            # the failure to the tests that need the data, not the whole class
+            cls._modules = None
+        if cls._modules is not None:
+            # Populate the lazy description/signature fields up front so the
+            # shared module objects are not written to while tests run
+            load_module_metadata(cls._modules)
+        cls._lsmod_result = None
+        if _HAS_LSMOD:
+            # Raw bytes: the fields are ASCII and only decoded after splitting
+            cls._lsmod_result = subprocess.run(['lsmod'], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            if cls._lsmod_result.returncode != 0:
+                cls._lsmod_result = None
+        cls._lsmod = cls._parse_lsmod_once() if cls._lsmod_result is not None else None
+    
+    @classmethod
+    def _parse_lsmod_once(cls) -> Mapping[str, Any]:
+        """Parse the cached lsmod output into names, sizes, ref counts and dependencies."""
+        parsed = {'names': set(), 'sizes': {}, 'refs': {}, 'deps': {}}
+        lines = iter(cls._lsmod_result.stdout.splitlines())
+        next(lines, None)  # Skip header
+        for line in lines:
+            # The dependency list stays unsplit as the fourth field
+            parts = line.split(None, 3)
+            if not parts:
+                continue
+            name = parts[0].decode()
+            parsed['names'].add(name)
+            parsed['sizes'][name] = int(parts[1])
+            parsed['refs'][name] = int(parts[2])
+            parsed['deps'][name] = _parse_lsmod_deps(parts[3].decode()) if len(parts) > 3 else frozenset()
+        # Shared by every test in the class, so hand out read-only views where
+        # possible; sizes and refs stay dicts because assertDictEqual needs them
+        parsed['names'] = frozenset(parsed['names'])
+        return MappingProxyType(parsed)
+    
+    def _get_lsmod(self, field: str):
+        """Return one view of the parsed lsmod output, skipping if lsmod failed."""
+        if self._lsmod is None:
+            self.skipTest("lsmod command failed")
+        return self._lsmod[field]
+
+
+class TestKernelModuleLister(_CachedModuleData, unittest.TestCase):
     """Test cases for the kernel module lister functionality."""
     
     def setUp(self):
@@ -28,7 +120,7 @@ class TestKernelModuleLister(unittest.TestCase):
         
     def test_parse_proc_modules_basic(self):
         """Test basic parsing of /proc/modules."""
-        modules = parse_proc_modules()
+        modules = self._modules
         
         # Should return a list
         self.assertIsInstance(modules, list)
@@ -55,24 +147,16 @@ class TestKernelModuleLister(unittest.TestCase):
     
     def test_format_size(self):
         """Test the size formatting function."""
-        test_cases = [
-            (1024, "1.0 KB"),
-            (1536, "1.5 KB"),
-            (1048576, "1.0 MB"),
-            (1073741824, "1.0 GB"),
-            (512, "512.0 B"),
-            (0, "0.0 B"),
-        ]
-        
-        for size_bytes, expected in test_cases:
+        for size_bytes, expected in _FORMAT_SIZE_CASES:
             with self.subTest(size=size_bytes):
                 result = format_size(size_bytes)
                 self.assertEqual(result, expected)
     
+    @unittest.skipUnless(_HAS_LSMOD, "lsmod command not available")
     def test_module_names_match_lsmod(self):
         """Test that module names match between our script and lsmod."""
         # Get modules from our script
-        our_modules = parse_proc_modules()
+        our_modules = self._modules
         our_names = {module.name for module in our_modules}
         
         # Get modules from lsmod
@@ -82,61 +166,39 @@ class TestKernelModuleLister(unittest.TestCase):
         self.assertEqual(our_names, lsmod_names, 
                         "Module names should match between our script and lsmod")
     
+    @unittest.skipUnless(_HAS_LSMOD, "lsmod command not available")
     def test_module_sizes_match_lsmod(self):
         """Test that module sizes match between our script and lsmod."""
-        # Get modules from our script
-        our_modules = parse_proc_modules()
-        our_sizes = {module.name: module.size for module in our_modules}
-        
         # Get modules from lsmod
         lsmod_sizes = self._get_lsmod_module_sizes()
         
-        # Sizes should match
-        for name in our_sizes:
-            with self.subTest(module=name):
-                self.assertEqual(our_sizes[name], lsmod_sizes[name],
-                               f"Size mismatch for module {name}")
+        # Sizes should match; a failure diff names the offending modules
+        self.assertDictEqual({module.name: module.size for module in self._modules}, lsmod_sizes,
+                             "Size mismatch between our script and lsmod")
     
+    @unittest.skipUnless(_HAS_LSMOD, "lsmod command not available")
     def test_module_ref_counts_match_lsmod(self):
         """Test that reference counts match between our script and lsmod."""
-        # Get modules from our script
-        our_modules = parse_proc_modules()
-        our_ref_counts = {module.name: module.ref_count for module in our_modules}
-        
         # Get modules from lsmod
         lsmod_ref_counts = self._get_lsmod_ref_counts()
         
-        # Reference counts should match
-        for name in our_ref_counts:
-            with self.subTest(module=name):
-                self.assertEqual(our_ref_counts[name], lsmod_ref_counts[name],
-                               f"Reference count mismatch for module {name}")
+        # Reference counts should match; a failure diff names the offending modules
+        self.assertDictEqual({module.name: module.ref_count for module in self._modules}, lsmod_ref_counts,
+                             "Reference count mismatch between our script and lsmod")
     
+    @unittest.skipUnless(_HAS_LSMOD, "lsmod command not available")
     def test_module_dependencies_match_lsmod(self):
         """Test that module dependencies match between our script and lsmod."""
-        # Get modules from our script
-        our_modules = parse_proc_modules()
-        our_deps = {module.name: set(module.dependencies) for module in our_modules}
-        
         # Get modules from lsmod
         lsmod_deps = self._get_lsmod_dependencies()
         
-        # Dependencies should match
-        for name in our_deps:
-            with self.subTest(module=name):
-                self.assertEqual(our_deps[name], lsmod_deps[name],
-                               f"Dependencies mismatch for module {name}")
+        # Dependencies should match; a failure diff names the offending modules
+        self.assertDictEqual({module.name: frozenset(module.dependencies) for module in self._modules}, lsmod_deps,
+                             "Dependencies mismatch between our script and lsmod")
     
     def test_script_output_format(self):
         """Test that the script produces properly formatted output."""
-        # Capture stdout
-        f = io.StringIO()
-        with redirect_stdout(f):
-            from list_kernel_modules import display_modules
-            modules = parse_proc_modules()
-            display_modules(modules, show_details=False)
-        
-        output = f.getvalue()
+        output = self._capture(display_modules, self._modules, show_details=False)
         
         # Should contain expected headers
         self.assertIn("Module Name", output)
@@ -149,14 +211,7 @@ class TestKernelModuleLister(unittest.TestCase):
     
     def test_script_detailed_output_format(self):
         """Test that the script produces properly formatted detailed output."""
-        # Capture stdout
-        f = io.StringIO()
-        with redirect_stdout(f):
-            from list_kernel_modules import display_modules
-            modules = parse_proc_modules()
-            display_modules(modules, show_details=True)
-        
-        output = f.getvalue()
+        output = self._capture(display_modules, self._modules, show_details=True)
         
         # Should contain expected headers
         self.assertIn("Module:", output)
@@ -169,242 +224,102 @@ class TestKernelModuleLister(unittest.TestCase):
     def test_count_option(self):
         """Test that the --count option works correctly."""
         # Run the script with --count option
-        result = subprocess.run([
-            sys.executable, 'list_kernel_modules.py', '--count'
-        ], capture_output=True, text=True, cwd=os.path.dirname(__file__))
+        returncode, stdout = _run_main('--count')
         
-        self.assertEqual(result.returncode, 0)
+        self.assertEqual(returncode, 0)
         
         # Should output a count
-        output = result.stdout.strip()
+        output = stdout.strip()
         self.assertTrue(output.startswith("Total loaded kernel modules:"))
         
         # Extract the number and verify it matches our parsing
         count_str = output.split(":")[1].strip()
         count = int(count_str)
         
-        our_modules = parse_proc_modules()
+        our_modules = self._modules
         self.assertEqual(count, len(our_modules))
     
     def test_help_option(self):
         """Test that the --help option works correctly."""
-        result = subprocess.run([
-            sys.executable, 'list_kernel_modules.py', '--help'
-        ], capture_output=True, text=True, cwd=os.path.dirname(__file__))
+        returncode, stdout = _run_main('--help')
         
-        self.assertEqual(result.returncode, 0)
+        self.assertEqual(returncode, 0)
         
         # Should contain help text
-        self.assertIn("List all kernel modules (loadable and builtin)", result.stdout)
-        self.assertIn("--detailed", result.stdout)
-        self.assertIn("--count", result.stdout)
+        self.assertIn("List all kernel modules (loadable and builtin)", stdout)
+        self.assertIn("--detailed", stdout)
+        self.assertIn("--count", stdout)
     
-    def _get_lsmod_module_names(self) -> Set[str]:
+    def _capture(self, fn, *args, **kwargs) -> str:
+        """Call fn and return everything it printed to stdout."""
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            fn(*args, **kwargs)
+        return buf.getvalue()
+    
+    def _get_lsmod_module_names(self) -> FrozenSet[str]:
         """Get module names from lsmod command."""
-        try:
-            result = subprocess.run(['lsmod'], capture_output=True, text=True, check=True)
-            lines = result.stdout.strip().split('\n')[1:]  # Skip header
-            names = set()
-            for line in lines:
-                if line.strip():
-                    name = line.split()[0]
-                    names.add(name)
-            return names
-        except subprocess.CalledProcessError:
-            self.skipTest("lsmod command not available")
+        return self._get_lsmod('names')
     
     def _get_lsmod_module_sizes(self) -> Dict[str, int]:
         """Get module sizes from lsmod command."""
-        try:
-            result = subprocess.run(['lsmod'], capture_output=True, text=True, check=True)
-            lines = result.stdout.strip().split('\n')[1:]  # Skip header
-            sizes = {}
-            for line in lines:
-                if line.strip():
-                    parts = line.split()
-                    name = parts[0]
-                    size = int(parts[1])
-                    sizes[name] = size
-            return sizes
-        except subprocess.CalledProcessError:
-            self.skipTest("lsmod command not available")
+        return self._get_lsmod('sizes')
     
     def _get_lsmod_ref_counts(self) -> Dict[str, int]:
         """Get reference counts from lsmod command."""
-        try:
-            result = subprocess.run(['lsmod'], capture_output=True, text=True, check=True)
-            lines = result.stdout.strip().split('\n')[1:]  # Skip header
-            ref_counts = {}
-            for line in lines:
-                if line.strip():
-                    parts = line.split()
-                    name = parts[0]
-                    ref_count = int(parts[2])
-                    ref_counts[name] = ref_count
-            return ref_counts
-        except subprocess.CalledProcessError:
-            self.skipTest("lsmod command not available")
+        return self._get_lsmod('refs')
     
-    def _get_lsmod_dependencies(self) -> Dict[str, Set[str]]:
+    def _get_lsmod_dependencies(self) -> Dict[str, FrozenSet[str]]:
         """Get module dependencies from lsmod command."""
-        try:
-            result = subprocess.run(['lsmod'], capture_output=True, text=True, check=True)
-            lines = result.stdout.strip().split('\n')[1:]  # Skip header
-            dependencies = {}
-            for line in lines:
-                if line.strip():
-                    parts = line.split()
-                    name = parts[0]
-                    # Dependencies are in the "Used by" column (index 3+)
-                    if len(parts) > 3:
-                        deps_str = ' '.join(parts[3:])
-                        deps = set(deps_str.split(',')) if deps_str else set()
-                        # Remove empty strings and status markers
-                        deps = {dep.strip() for dep in deps if dep.strip() and not dep.strip().startswith('[')}
-                    else:
-                        deps = set()
-                    dependencies[name] = deps
-            return dependencies
-        except subprocess.CalledProcessError:
-            self.skipTest("lsmod command not available")
+        return self._get_lsmod('deps')
 
 
-class TestIntegration(unittest.TestCase):
+class TestIntegration(_CachedModuleData, unittest.TestCase):
     """Integration tests comparing full output."""
     
+    @unittest.skipUnless(_HAS_LSMOD, "lsmod command not available")
     def test_full_output_consistency(self):
-        """Test that our script output is consistent with lsmod."""
-        # Get our script output
-        our_result = subprocess.run([
-            sys.executable, 'list_kernel_modules.py'
-        ], capture_output=True, text=True, cwd=os.path.dirname(__file__))
-        
-        self.assertEqual(our_result.returncode, 0)
-        
-        # Get lsmod output
-        lsmod_result = subprocess.run(['lsmod'], capture_output=True, text=True)
-        
-        if lsmod_result.returncode != 0:
-            self.skipTest("lsmod command not available")
-        
-        # Parse both outputs
-        our_modules = self._parse_our_output(our_result.stdout)
-        lsmod_modules = self._parse_lsmod_output(lsmod_result.stdout)
+        """Test that our parsed modules are consistent with lsmod."""
+        our_modules = {module.name: module for module in self._modules}
+        lsmod_sizes = self._get_lsmod('sizes')
+        lsmod_ref_counts = self._get_lsmod('refs')
         
         # Should have same number of modules
-        self.assertEqual(len(our_modules), len(lsmod_modules))
+        self.assertEqual(len(our_modules), len(lsmod_sizes))
         
         # All modules should match
-        for name in our_modules:
+        for name, module in our_modules.items():
             with self.subTest(module=name):
-                self.assertIn(name, lsmod_modules)
-                our_mod = our_modules[name]
-                lsmod_mod = lsmod_modules[name]
-                
-                self.assertEqual(our_mod['size'], lsmod_mod['size'])
-                self.assertEqual(our_mod['ref_count'], lsmod_mod['ref_count'])
-                # Skip dependency comparison for simple output format since it doesn't show dependencies
-                # self.assertEqual(our_mod['dependencies'], lsmod_mod['dependencies'])
+                self.assertIn(name, lsmod_sizes)
+                self.assertEqual(module.size, lsmod_sizes[name])
+                self.assertEqual(module.ref_count, lsmod_ref_counts[name])
     
-    def _parse_our_output(self, output: str) -> Dict[str, Dict]:
-        """Parse our script's output into a structured format."""
-        modules = {}
-        lines = output.strip().split('\n')
+    def test_default_output_lists_modules(self):
+        """Test that the default output has the table headers and a row per module."""
+        returncode, stdout = _run_main()
         
-        # Skip header lines
-        data_lines = []
-        in_data = False
-        for line in lines:
-            if 'Module Name' in line and '|' in line:
-                in_data = True
-                continue
-            elif line.startswith('-'):
-                continue
-            elif in_data and line.strip():
-                data_lines.append(line)
+        self.assertEqual(returncode, 0)
         
-        for line in data_lines:
-            # Handle table format with | separators
-            if '|' in line and not line.strip().startswith('|---'):
-                parts = [p.strip() for p in line.split('|') if p.strip()]
-                if len(parts) >= 5:
-                    name = parts[0]
-                    size_str = parts[2]  # Size is in the 3rd column
-                    ref_count = int(parts[3])
-                    status = parts[4]
-                    
-                    # Convert size back to bytes
-                    size = self._parse_size_to_bytes(size_str)
-                    
-                    modules[name] = {
-                        'size': size,
-                        'ref_count': ref_count,
-                        'status': status,
-                        'dependencies': set()  # Not shown in simple output
-                    }
-            else:
-                # Fallback to space-separated format
-                parts = line.split()
-                if len(parts) >= 4:
-                    name = parts[0]
-                    size_str = parts[1] + ' ' + parts[2]  # Size and unit are separate
-                    ref_count = int(parts[3])
-                    status = parts[4]
-                    
-                    # Convert size back to bytes
-                    size = self._parse_size_to_bytes(size_str)
-                    
-                    modules[name] = {
-                        'size': size,
-                        'ref_count': ref_count,
-                        'status': status,
-                        'dependencies': set()  # Not shown in simple output
-                    }
+        # Should contain expected headers
+        for header in ("Module Name", "Type", "Size", "Ref Count", "Status", "Description"):
+            self.assertIn(header, stdout)
         
-        return modules
+        # Every loaded module should have a row
+        self.assertEqual(self._parse_our_output(stdout), {module.name for module in self._modules})
     
-    def _parse_lsmod_output(self, output: str) -> Dict[str, Dict]:
-        """Parse lsmod output into a structured format."""
-        modules = {}
-        lines = output.strip().split('\n')[1:]  # Skip header
+    def _parse_our_output(self, output: str) -> Set[str]:
+        """Collect the module names listed in our script's table output."""
+        names = set()
         
-        for line in lines:
-            if line.strip():
-                parts = line.split()
-                name = parts[0]
-                size = int(parts[1])
-                ref_count = int(parts[2])
-                
-                # Dependencies are in the "Used by" column
-                if len(parts) > 3:
-                    deps_str = ' '.join(parts[3:])
-                    deps = set(deps_str.split(',')) if deps_str else set()
-                    # Remove empty strings and status markers
-                    deps = {dep.strip() for dep in deps if dep.strip() and not dep.strip().startswith('[')}
-                else:
-                    deps = set()
-                
-                modules[name] = {
-                    'size': size,
-                    'ref_count': ref_count,
-                    'dependencies': deps
-                }
+        # Rows follow the table header; structured values come from the cache instead
+        in_data = False
+        for line in output.splitlines():
+            if 'Module Name' in line and '|' in line:
+                in_data = True
+            elif in_data and line.startswith('| '):
+                names.add(line[2:].split('|', 1)[0].strip())
         
-        return modules
-    
-    def _parse_size_to_bytes(self, size_str: str) -> int:
-        """Convert human-readable size back to bytes."""
-        size_str = size_str.upper()
-        if size_str.endswith(' B'):
-            return int(float(size_str[:-2]))
-        elif size_str.endswith(' KB'):
-            return int(float(size_str[:-3]) * 1024)
-        elif size_str.endswith(' MB'):
-            return int(float(size_str[:-3]) * 1024 * 1024)
-        elif size_str.endswith(' GB'):
-            return int(float(size_str[:-3]) * 1024 * 1024 * 1024)
-        else:
-            return int(float(size_str))
+        return names
 
 
 if __name__ == '__main__':